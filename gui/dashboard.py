@@ -226,18 +226,9 @@ class Dashboard(QWidget):
 
         self.tabs.addTab(sensors_tab, "Sensors")
 
-        # =========== Plot Tab ============
-        self.plot_tab = PlotTab()
-        self.tabs.addTab(self.plot_tab, "Plot")
-        self.plot_tab.all_streams_removed.connect(self.lsl_browser.clear_all_plot_markers)
-        self.plot_tab.all_streams_removed.connect(self.log_all_streams_removed)
-        self.plot_tab.all_streams_removed.connect(self.handle_all_streams_removed)
-        self.plot_tab.discover_streams_requested.connect(self.on_discover_streams_from_plot)
-
-        # =========== Analysis Tab ============
-        # Pass the muse_sensor so the analysis module can access the board_shim
-        self.analysis_widget = BrainPowerAnalysisModule(sensor=self.muse_sensor)
-        self.tabs.addTab(self.analysis_widget, "Analysis")
+        # Plot and Analysis tabs are built by populate_tabs() once the window is shown
+        self.plot_tab = None
+        self.analysis_widget = None
 
         # =========== Finalize ============
         self.setLayout(main_layout)
@@ -254,6 +245,29 @@ class Dashboard(QWidget):
         self.polar_connect_button.setEnabled(True)
         self.polar_disconnect_button.setEnabled(False)
 
+    def populate_tabs(self):
+        """
+        Build the Plot and Analysis tabs.
+
+        Deferred out of init_ui so the window (with the Sensors tab) can be
+        painted first; safe to call more than once.
+        """
+        if self.plot_tab is not None:
+            return
+
+        # =========== Plot Tab ============
+        self.plot_tab = PlotTab()
+        self.tabs.addTab(self.plot_tab, "Plot")
+        self.plot_tab.all_streams_removed.connect(self.lsl_browser.clear_all_plot_markers)
+        self.plot_tab.all_streams_removed.connect(self.log_all_streams_removed)
+        self.plot_tab.all_streams_removed.connect(self.handle_all_streams_removed)
+        self.plot_tab.discover_streams_requested.connect(self.on_discover_streams_from_plot)
+
+        # =========== Analysis Tab ============
+        # Pass the muse_sensor so the analysis module can access the board_shim
+        self.analysis_widget = BrainPowerAnalysisModule(sensor=self.muse_sensor)
+        self.tabs.addTab(self.analysis_widget, "Analysis")
+
     # -----------------------------------------------------------
     # MUSE
     # -----------------------------------------------------------
@@ -335,11 +349,13 @@ class Dashboard(QWidget):
     # -----------------------------------------------------------
     def on_add_stream(self, stream_info):
         print(f"[DASHBOARD DEBUG] on_add_stream called for: {stream_info.name()}")
+        self.populate_tabs()
         self.plot_tab.add_stream(stream_info)
         self.log(f"Added stream to plot: {stream_info.name()} ({stream_info.type()})")
 
     def on_remove_stream(self, stream_info):
         print(f"[DASHBOARD DEBUG] on_remove_stream called for: {stream_info.name()}")
+        self.populate_tabs()
         self.plot_tab.remove_stream(stream_info)
         self.log(f"Removed stream from plot: {stream_info.name()} ({stream_info.type()})")
 
@@ -358,6 +374,9 @@ class Dashboard(QWidget):
 
     def handle_tab_changed(self, index):
         """OPTIMIZED: Debounced tab change handler to reduce lag."""
+        if self.plot_tab is None:
+            return
+
         # Store the pending tab index and start debounce timer
         self.pending_tab_index = index
         self.tab_change_timer.start()
@@ -371,7 +390,7 @@ class Dashboard(QWidget):
 
     def _handle_tab_changed_delayed(self):
         """OPTIMIZED: Delayed handler after debounce (reduces rapid switching lag)."""
-        if self.pending_tab_index is None:
+        if self.pending_tab_index is None or self.plot_tab is None:
             return
 
         index = self.pending_tab_index
@@ -520,9 +539,15 @@ class MainWindow(QMainWindow):
         self.dashboard = Dashboard()
         self.setCentralWidget(self.dashboard)
 
+    def populate_tabs(self):
+        """Build the deferred dashboard tabs (scheduled right after show())."""
+        self.dashboard.populate_tabs()
+
     def closeEvent(self, event):
         # Gracefully disconnect Muse and Polar if still connected
         self.dashboard.muse_sensor.kill_publisher()
         self.dashboard.disconnect_muse()
         self.dashboard.disconnect_polar()
+        # Stop the LSL fetcher's background stream resolver
+        self.dashboard.lsl_fetcher.close()
         super(MainWindow, self).closeEvent(event)
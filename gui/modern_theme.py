@@ -458,21 +458,25 @@ class ModernTheme:
         """Apply modern styling to a PlotWidget - clean white theme."""
         # Set background to white
         plot_widget.setBackground(ModernTheme.COLORS['plot_bg'])
+        ModernTheme.style_plot_item(plot_widget)
 
+        # Note: Do NOT apply QWidget stylesheet here as it conflicts with PyQtGraph rendering
+        # PyQtGraph uses internal OpenGL/QPainter rendering which doesn't work well with CSS
+        # The card container provides the border and styling instead
+
+    @staticmethod
+    def style_plot_item(plot_item):
+        """Apply modern styling to a PlotItem (e.g. one cell of a GraphicsLayoutWidget)."""
         # Get the ViewBox and set background
-        vb = plot_widget.getViewBox()
+        vb = plot_item.getViewBox()
         if vb is not None:
             vb.setBackgroundColor(ModernTheme.COLORS['plot_bg'])
 
         # Style axes with dark text for white background
         for axis in ['left', 'bottom', 'right', 'top']:
-            ax = plot_widget.getAxis(axis)
+            ax = plot_item.getAxis(axis)
             ax.setPen(pg.mkPen(color=ModernTheme.COLORS['plot_axis'], width=2))
             ax.setTextPen(pg.mkPen(color=ModernTheme.COLORS['text_primary']))
 
         # Add visible grid on white background
-        plot_widget.showGrid(x=True, y=True, alpha=0.3)
-
-        # Note: Do NOT apply QWidget stylesheet here as it conflicts with PyQtGraph rendering
-        # PyQtGraph uses internal OpenGL/QPainter rendering which doesn't work well with CSS
-        # The card container provides the border and styling instead
+        plot_item.showGrid(x=True, y=True, alpha=0.3)
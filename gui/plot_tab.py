@@ -13,16 +13,17 @@ except Exception as e:
     pg.setConfigOptions(useOpenGL=False)
     _opengl_enabled = False
 
-from scipy.signal import welch, butter, filtfilt
+from scipy.integrate import trapezoid
+from scipy.signal import welch, butter, filtfilt, sosfilt, sosfilt_zi
 from PyQt5.QtCore import QTimer, pyqtSignal
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QDoubleSpinBox, QLabel, QCheckBox,
     QScrollArea, QSplitter, QTabWidget
 )
 from PyQt5.QtCore import Qt
-from pylsl import StreamInlet, StreamInfo
+from pylsl import StreamInlet, StreamInfo, cf_float32, cf_double64
 import time
-from brainflow import DataFilter, DetrendOperations, FilterTypes, WindowOperations
+from functools import lru_cache
 from gui.modern_theme import ModernTheme
 from gui.ring_buffer import TwoBufferRing
 
@@ -30,6 +31,29 @@ from src.common.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# LSL channel formats that pull_chunk can write straight into a numpy buffer (dest_obj)
+_LSL_DEST_DTYPES = {cf_float32: np.float32, cf_double64: np.float64}
+
+
+@lru_cache(maxsize=32)
+def _design_display_filter(sr, bp_low, bp_high, bs_low, bs_high):
+    """
+    Design the display bandpass + bandstop cascade as (sos, zi), or None if the band is invalid.
+
+    Cached per (sr, cutoffs) and shared by all channels/tabs; bounded so that
+    stepping through the filter spinboxes cannot grow it without limit.
+    """
+    try:
+        nyq = sr / 2.0
+        sos_bp = butter(2, [bp_low, min(bp_high, nyq * 0.99)], btype='bandpass', fs=sr, output='sos')
+        sos_bs = butter(2, [bs_low, min(bs_high, nyq * 0.99)], btype='bandstop', fs=sr, output='sos')
+        sos = np.vstack((sos_bp, sos_bs))
+        return sos, sosfilt_zi(sos)
+    except ValueError as e:
+        print(f"Invalid filter settings {(sr, bp_low, bp_high, bs_low, bs_high)}: {e}")
+        return None
+
+
 class PlotTab(QWidget):
     """
     A tab that plots multiple LSL streams via PyQtGraph, using ring buffers
@@ -51,10 +75,12 @@ class PlotTab(QWidget):
         self.plot_time_window = 5.0     # default time window in seconds
         self.refresh_rate = 25.0        # 25 fps - matches Analysis tab (was 20, now optimized with display-only filtering)
         self.max_points = 500           # CRITICAL: Reduced from 1000 for 2x faster rendering
+        self.max_chunk = 1024           # Max samples per pull_chunk (pylsl default), sizes the pull buffers
         self.psd_window_s = 2.0         # PSD calculation window in seconds
         self.psd_update_counter = 0     # Counter to throttle PSD updates
         self.psd_update_interval = 3    # Update PSD every N frames (reduce CPU load)
         self.is_visible = True          # Track if tab is visible (optimization)
+        self.channel_row_height = 160   # Height of one channel row (plot + filter controls)
 
         # Log OpenGL status
         if _opengl_enabled:
@@ -162,6 +188,7 @@ class PlotTab(QWidget):
         #       "uid": str,
         #       "inlet": StreamInlet,
         #       "sr": float,
+        #       "pull_buf": np.ndarray or None,  # Preallocated (max_chunk, chCount) dest for pull_chunk
         #       "channels": [ {...}, {...}, ...]
         #   },
         #   ...
@@ -172,7 +199,7 @@ class PlotTab(QWidget):
         #   "name": str,
         #   "ring_buffer": TwoBufferRing,    # Optimized circular buffer for time/value
         #   "plot_item": PlotDataItem,
-        #   "plot_widget": PlotWidget,       # Keep reference for batch updates
+        #   "plot_widget": PlotItem,         # Cell in the shared GraphicsLayoutWidget
         #   "filter_checkbox": QCheckBox,
         #   "bandpass_low_spin": QDoubleSpinBox,   # IXR-Suite default: 1.0 Hz
         #   "bandpass_high_spin": QDoubleSpinBox,  # IXR-Suite default: 59.0 Hz
@@ -186,6 +213,8 @@ class PlotTab(QWidget):
         self.stream_uids = set()
         self.is_paused = True
         self.last_xrange_update = None  # Track last X-range to avoid redundant updates
+        self.plots_layout_widget = None # Single GraphicsLayoutWidget holding every channel plot
+        self.master_plot_item = None    # First channel plot; all others are X-linked to it
 
         # Wire up signals
         self.pause_button.clicked.connect(self.toggle_pause)
@@ -193,6 +222,13 @@ class PlotTab(QWidget):
         self.discover_button.clicked.connect(self.on_discover_streams)
         self.window_spin.valueChanged.connect(self.on_window_spin_changed)
 
+        # OPTIMIZATION: Debounce filter spinbox edits so dragging a value doesn't redesign filters per step
+        self.filter_update_timer = QTimer()
+        self.filter_update_timer.setSingleShot(True)
+        self.filter_update_timer.setInterval(200)  # 200ms debounce
+        self.filter_update_timer.timeout.connect(self._apply_pending_filter_updates)
+        self.pending_filter_channels = []
+
         # Timer for pulling data & updating
         self.timer = QTimer()
         self.timer.timeout.connect(self.update_plot)
@@ -235,62 +271,88 @@ class PlotTab(QWidget):
         pass
 
     def _apply_signal_processing(self, data, sr):
-        """Apply signal processing to EEG data (from IXR-Suite)."""
+        """
+        Apply signal processing to EEG data (from IXR-Suite).
+
+        Works along the last axis, so a whole (channels, samples) block is
+        detrended and filtered in one call. Returns a new array.
+        """
         try:
-            # Detrend
-            DataFilter.detrend(data, DetrendOperations.CONSTANT.value)
-            # Bandpass filter (1-59 Hz)
-            DataFilter.perform_bandpass(
-                data=data,
-                sampling_rate=sr,
-                start_freq=1.0,
-                stop_freq=59.0,
-                order=2,
-                filter_type=FilterTypes.BUTTERWORTH.value,
-                ripple=0.0
-            )
-            # Bandstop filter (48-52 Hz to remove line noise)
-            DataFilter.perform_bandstop(
-                data=data,
-                sampling_rate=sr,
-                start_freq=48.0,
-                stop_freq=52.0,
-                order=2,
-                filter_type=FilterTypes.BUTTERWORTH.value,
-                ripple=0.0
-            )
+            # Detrend (constant)
+            data = data - data.mean(axis=-1, keepdims=True)
+            # Bandpass (1-59 Hz) + bandstop (48-52 Hz, line noise), cached cascade
+            display_filter = self._get_display_filter(sr)
+            if display_filter is not None:
+                data = sosfilt(display_filter[0], data, axis=-1)
         except Exception as e:
             print(f"Signal processing error: {e}")
         return data
 
     def _calculate_psd_and_bands(self, data, sr):
-        """Calculate PSD and band powers (from IXR-Suite)."""
+        """
+        Calculate PSD and band powers (from IXR-Suite).
+
+        Accepts a single channel or a (channels, samples) block; Welch runs
+        once along the last axis for all channels.
+
+        Returns:
+            ((psd, freqs), bands) where bands is a list of delta/theta/alpha/beta/gamma
+            powers (one value per channel), or (None, None) on failure.
+        """
         try:
-            psd_size = DataFilter.get_nearest_power_of_two(int(sr))
-            if len(data) < psd_size:
+            # Fixed-size segments keep PSD memory bounded regardless of psd_window_s;
+            # median averaging is robust to single-segment EEG artifacts.
+            nperseg = min(256, data.shape[-1])
+            if nperseg < 2:
                 return None, None
 
-            psd_data = DataFilter.get_psd_welch(
-                data=data,
-                nfft=psd_size,
-                overlap=psd_size // 2,
-                sampling_rate=int(sr),
-                window=WindowOperations.BLACKMAN_HARRIS.value
+            freqs, psd = welch(
+                data,
+                fs=sr,
+                nperseg=nperseg,
+                noverlap=nperseg // 2,
+                detrend='constant',
+                return_onesided=True,
+                scaling='density',
+                average='median',
+                axis=-1
             )
 
-            # Calculate band powers
-            delta = DataFilter.get_band_power(psd_data, 1.0, 4.0)
-            theta = DataFilter.get_band_power(psd_data, 4.0, 8.0)
-            alpha = DataFilter.get_band_power(psd_data, 8.0, 13.0)
-            beta = DataFilter.get_band_power(psd_data, 13.0, 30.0)
-            gamma = DataFilter.get_band_power(psd_data, 30.0, 60.0)
+            # Calculate band powers (trapezoid integration, as BrainFlow's get_band_power)
+            bands = []
+            for low, high in ((1.0, 4.0), (4.0, 8.0), (8.0, 13.0), (13.0, 30.0), (30.0, 60.0)):
+                mask = (freqs >= low) & (freqs <= high)
+                bands.append(trapezoid(psd[..., mask], freqs[mask], axis=-1))
 
-            bands = [delta, theta, alpha, beta, gamma]
-            return psd_data, bands
+            return (psd, freqs), bands
         except Exception as e:
             print(f"PSD calculation error: {e}")
             return None, None
 
+    @staticmethod
+    def _get_display_filter(sr, bp_low=1.0, bp_high=59.0, bs_low=48.0, bs_high=52.0):
+        """
+        Return cached (sos, zi) for the display bandpass + bandstop cascade.
+
+        Channels sharing a sample rate and cutoffs (e.g. all EEG channels of one
+        stream) reuse a single filter design instead of redesigning per channel.
+        """
+        return _design_display_filter(float(sr), float(bp_low), float(bp_high),
+                                      float(bs_low), float(bs_high))
+
+    def _refresh_display_filter(self, ch_info):
+        """Read the channel's filter spinboxes and look up the matching cached filter."""
+        if ch_info.get("bandpass_low_spin") is None:
+            ch_info["display_filter"] = self._get_display_filter(ch_info["sr"])
+            return
+        ch_info["display_filter"] = self._get_display_filter(
+            ch_info["sr"],
+            ch_info["bandpass_low_spin"].value(),
+            ch_info["bandpass_high_spin"].value(),
+            ch_info["bandstop_low_spin"].value(),
+            ch_info["bandstop_high_spin"].value()
+        )
+
 
     def on_window_spin_changed(self, val):
         print("on_window_spin_changed")
@@ -356,12 +418,16 @@ class PlotTab(QWidget):
         else:  # EEG or other
             y_range = (-150, 150)  # EEG data range
 
+        # OPTIMIZED: Preallocate the pull buffer so pylsl fills it directly (no list -> ndarray copy)
+        dest_dtype = _LSL_DEST_DTYPES.get(full_info.channel_format())
+        pull_buf = np.empty((self.max_chunk, ch_count), dtype=dest_dtype) if dest_dtype is not None else None
+
         channels_list = []
         for i in range(ch_count):
             ch_name = channel_names[i]
             channels_list.append({
                 "name": ch_name,
-                "ring_buffer": TwoBufferRing(ring_size, dtype=np.float64),  # Optimized buffer
+                "ring_buffer": TwoBufferRing(ring_size, dtype=np.float32),  # float32 values, float64 timestamps
                 "plot_item": None,
                 "plot_widget": None,  # Will be set in _rebuild_subplots
                 "filter_checkbox": None,
@@ -370,25 +436,28 @@ class PlotTab(QWidget):
                 "bandstop_low_spin": None,
                 "bandstop_high_spin": None,
                 "filter_enabled": True if is_eeg else False,  # Auto-enable for EEG, disable for others
+                "display_filter": self._get_display_filter(sr) if is_eeg else None,  # Cached (sos, zi)
                 "sr": sr,
                 "y_range": y_range,  # Store Y-range for this channel
                 "is_eeg": is_eeg  # Track if this is an EEG channel
             })
 
-        self.streams_data.append({
+        sd = {
             "uid": uid,
             "inlet": inlet,
             "sr": sr,
+            "pull_buf": pull_buf,
             "channels": channels_list,
             "is_eeg": is_eeg,
             "is_gyro": is_gyro,
             "is_ppg": is_ppg,
             "stream_type": stream_type
-        })
+        }
+        self.streams_data.append(sd)
         self.stream_uids.add(uid)
 
         # OPTIMIZED: Pre-fill ring buffers with initial data for instant display
-        self._prefill_stream_buffers(inlet, channels_list)
+        self._prefill_stream_buffers(sd)
 
         # CRITICAL FIX: Async rebuild to prevent UI blocking
         QTimer.singleShot(0, self._rebuild_subplots)
@@ -463,45 +532,80 @@ class PlotTab(QWidget):
             if w:
                 w.deleteLater()
 
+        self.plots_layout_widget = None
+        self.master_plot_item = None
+
         # Show/hide placeholder based on whether we have streams
         if len(self.streams_data) == 0:
             self.placeholder_label.setVisible(True)
+            return
         else:
             self.placeholder_label.setVisible(False)
 
+        # OPTIMIZED: One GraphicsLayoutWidget with a PlotItem per channel instead of a
+        # PlotWidget per channel - a single scene/GL context is rendered per frame.
+        # Filter controls sit in a parallel column with matching row heights.
+        channel_count = sum(len(sd["channels"]) for sd in self.streams_data)
+        panel_height = channel_count * self.channel_row_height
+
+        panel_widget = QWidget()
+        panel_layout = QHBoxLayout(panel_widget)
+        panel_layout.setContentsMargins(4, 2, 4, 2)
+        panel_layout.setSpacing(8)
+
+        plots_layout_widget = pg.GraphicsLayoutWidget()
+        plots_layout_widget.setBackground(ModernTheme.COLORS['plot_bg'])
+        plots_layout_widget.ci.layout.setContentsMargins(0, 0, 0, 0)
+        plots_layout_widget.ci.layout.setSpacing(0)
+        plots_layout_widget.setFixedHeight(panel_height)
+        panel_layout.addWidget(plots_layout_widget, stretch=1)
+
+        controls_widget = QWidget()
+        controls_layout = QVBoxLayout(controls_widget)
+        controls_layout.setContentsMargins(0, 0, 0, 0)
+        controls_layout.setSpacing(0)
+        controls_widget.setFixedHeight(panel_height)
+        panel_layout.addWidget(controls_widget)
+
+        self.plots_layout_widget = plots_layout_widget
+
+        row_idx = 0
         for sd in self.streams_data:
             sr = sd["sr"]
             for ch_info in sd["channels"]:
-                row_widget = QWidget()
-                row_layout = QHBoxLayout(row_widget)
-                row_layout.setContentsMargins(4, 2, 4, 2)  # Tighter margins
-                row_layout.setSpacing(8)  # Less spacing
-
-                plot_w = pg.PlotWidget()
-                plot_w.showGrid(x=True, y=True, alpha=0.25)
+                plot_w = plots_layout_widget.addPlot(row=row_idx, col=0)
+                plots_layout_widget.ci.layout.setRowFixedHeight(row_idx, self.channel_row_height)
+                row_idx += 1
                 plot_w.showAxis('left', False)
                 plot_w.showAxis('bottom', False)
-                plot_w.setMenuEnabled('left', False)
-                plot_w.setMenuEnabled('bottom', False)
+                plot_w.setMenuEnabled(False)
                 plot_w.setTitle(ch_info["name"])
-                # Responsive height - no fixed constraints, let layout manage sizing
-                plot_w.setMinimumHeight(60)  # Just enough to be visible
 
                 # Apply modern theme to plot
-                ModernTheme.style_plot_widget(plot_w)
+                ModernTheme.style_plot_item(plot_w)
+
+                # Share the X axis (auto-scroll) with the first channel
+                if self.master_plot_item is None:
+                    self.master_plot_item = plot_w
+                else:
+                    plot_w.setXLink(self.master_plot_item)
 
                 # Set Y-range based on stream type
                 if "y_range" in ch_info:
                     plot_w.setYRange(ch_info["y_range"][0], ch_info["y_range"][1], padding=0)
 
-                # Create PlotDataItem with vibrant color + enable built-in downsampling
-                plot_item = plot_w.plot([], [], pen=pg.mkPen(width=2, color=ModernTheme.COLORS['accent_cyan']))
+                # Create PlotDataItem with vibrant color + enable built-in downsampling;
+                # connect='finite' breaks the line at NaN gaps instead of drawing through them
+                plot_item = plot_w.plot([], [], pen=pg.mkPen(width=2, color=ModernTheme.COLORS['accent_cyan']),
+                                        connect='finite')
                 plot_item.setDownsampling(auto=True, method='peak')
                 plot_item.setClipToView(True)
 
                 ch_info["plot_item"] = plot_item
-                ch_info["plot_widget"] = plot_w  # Store reference for batch ViewBox updates
-                row_layout.addWidget(plot_w, stretch=1)
+                ch_info["plot_widget"] = plot_w
+
+                row_widget = QWidget()
+                row_widget.setFixedHeight(self.channel_row_height)
 
                 # Filter UI - Editable controls with IXR-Suite defaults
                 filter_panel = QVBoxLayout()
@@ -581,21 +685,44 @@ class PlotTab(QWidget):
                 ch_info["bandpass_high_spin"] = bp_high_spin
                 ch_info["bandstop_low_spin"] = bs_low_spin
                 ch_info["bandstop_high_spin"] = bs_high_spin
+                if ch_info.get("is_eeg", False):
+                    self._refresh_display_filter(ch_info)
 
-                row_layout.addLayout(filter_panel)
-                self.channels_layout.addWidget(row_widget)
+                row_widget.setLayout(filter_panel)
+                controls_layout.addWidget(row_widget)
+
+        self.channels_layout.addWidget(panel_widget)
+        self.channels_layout.addStretch()
 
     def _update_filter_state(self, ch_info, state=None):
         """Update filter enabled state with user-editable parameters (defaults from IXR-Suite)."""
         if state is not None:
             ch_info["filter_enabled"] = (state == 2)  # Qt.Checked = 2
-        # Note: Filter parameters are read directly from spinboxes during update_plot()
-        print(f"Filter {'enabled' if ch_info['filter_enabled'] else 'disabled'} for {ch_info['name']}")
+            print(f"Filter {'enabled' if ch_info['filter_enabled'] else 'disabled'} for {ch_info['name']}")
+            return
+
+        # Spinbox edit: defer the filter lookup until the value settles
+        if not any(c is ch_info for c in self.pending_filter_channels):
+            self.pending_filter_channels.append(ch_info)
+        self.filter_update_timer.start()
+
+    def _apply_pending_filter_updates(self):
+        """Apply debounced filter parameter changes (called by filter_update_timer)."""
+        for ch_info in self.pending_filter_channels:
+            if ch_info.get("is_eeg", False):
+                self._refresh_display_filter(ch_info)
+        self.pending_filter_channels = []
 
     def update_plot(self):
         """Called ~20 fps. Pull new chunk, filter it, store in ring buffer, then plot. OPTIMIZED."""
-        # Skip updates if paused or not visible (major optimization)
-        if self.is_paused or not self.is_visible:
+        # Skip all filter/decimate/setData work while hidden (major optimization), but keep
+        # draining inlets so LSL doesn't build a backlog. Checked before is_paused because
+        # the dashboard also pauses this tab whenever it is hidden.
+        if not self.is_visible:
+            for sd in self.streams_data:
+                self._pull_chunk(sd)
+            return
+        if self.is_paused:
             return
 
         self.t1 = time.perf_counter(), time.process_time()
@@ -604,15 +731,10 @@ class PlotTab(QWidget):
 
         # 1) Pull new data and store in ring buffers (OPTIMIZED: direct numpy operations)
         for sd in self.streams_data:
-            inlet = sd["inlet"]
-            sr = sd["sr"]
-            samples, timestamps = inlet.pull_chunk(timeout=0.0)
-            if not timestamps:
+            t_arr, s_arr = self._pull_chunk(sd)  # s_arr shape (N, chCount)
+            if t_arr is None:
                 continue
 
-            t_arr = np.array(timestamps, dtype=np.float64)
-            s_arr = np.array(samples, dtype=np.float64)  # shape (N, chCount)
-
             channels_list = sd["channels"]
 
             # Store RAW data in ring buffers (filtering happens only on display - MASSIVE PERFORMANCE BOOST)
@@ -648,42 +770,21 @@ class PlotTab(QWidget):
                 # PERFORMANCE FIX: Apply filters ONLY to display data (not on every chunk!)
                 # This reduces filter operations from 600/sec to ~60/sec (10x improvement)
                 if ch_info.get("filter_enabled", False) and ch_info.get("is_eeg", False):
-                    try:
-                        # Get filter parameters from UI
-                        bp_low = ch_info.get("bandpass_low_spin").value() if ch_info.get("bandpass_low_spin") else 1.0
-                        bp_high = ch_info.get("bandpass_high_spin").value() if ch_info.get("bandpass_high_spin") else 59.0
-                        bs_low = ch_info.get("bandstop_low_spin").value() if ch_info.get("bandstop_low_spin") else 48.0
-                        bs_high = ch_info.get("bandstop_high_spin").value() if ch_info.get("bandstop_high_spin") else 52.0
-
-                        # Make a copy for filtering (don't modify ring buffer)
-                        y_filtered = y_buf.copy()
-
-                        # Apply filters to display data only
-                        DataFilter.detrend(y_filtered, DetrendOperations.CONSTANT.value)
-                        DataFilter.perform_bandpass(
-                            data=y_filtered,
-                            sampling_rate=int(sr),
-                            start_freq=bp_low,
-                            stop_freq=bp_high,
-                            order=2,
-                            filter_type=FilterTypes.BUTTERWORTH.value,
-                            ripple=0.0
-                        )
-                        DataFilter.perform_bandstop(
-                            data=y_filtered,
-                            sampling_rate=int(sr),
-                            start_freq=bs_low,
-                            stop_freq=bs_high,
-                            order=2,
-                            filter_type=FilterTypes.BUTTERWORTH.value,
-                            ripple=0.0
-                        )
-
-                        # Use filtered data for display
-                        y_buf = y_filtered
-                    except Exception as e:
-                        print(f"Filter error on {ch_info['name']}: {e}")
-                        # Fall back to raw data if filtering fails
+                    display_filter = ch_info.get("display_filter")
+                    if display_filter is not None:
+                        try:
+                            # Cached bandpass + bandstop cascade (parameters from UI, debounced)
+                            sos, zi = display_filter
+
+                            # Detrend (constant) into a new array - ring buffer stays untouched
+                            y_filtered = y_buf - y_buf.mean()
+                            y_filtered, _ = sosfilt(sos, y_filtered, zi=zi * y_filtered[0])
+
+                            # Use filtered data for display
+                            y_buf = y_filtered
+                        except Exception as e:
+                            print(f"Filter error on {ch_info['name']}: {e}")
+                            # Fall back to raw data if filtering fails
 
                 # OPTIMIZED: Manual decimation if large (use numpy views when possible)
                 L = len(y_buf)
@@ -704,11 +805,9 @@ class PlotTab(QWidget):
             # Only update if time has changed (avoid redundant setXRange calls)
             if self.last_xrange_update is None or abs(max_time - self.last_xrange_update) > 0.01:
                 self.last_xrange_update = max_time
-                # Batch update all plot widgets
-                for sd in self.streams_data:
-                    for ch_info in sd["channels"]:
-                        if ch_info["plot_widget"] is not None:
-                            ch_info["plot_widget"].setXRange(min_x, max_time, padding=0)
+                # Channel plots are X-linked, so setting the first one scrolls them all
+                if self.master_plot_item is not None:
+                    self.master_plot_item.setXRange(min_x, max_time, padding=0)
 
         # 4) OPTIMIZED: Calculate PSD for EEG streams (throttled, only when visible)
         self.psd_update_counter += 1
@@ -720,25 +819,32 @@ class PlotTab(QWidget):
                     continue
 
                 sr = sd["sr"]
-                for ch_info in sd["channels"]:
-                    if len(ch_info["ring_buffer"]) < int(self.psd_window_s * sr):
-                        continue
+                window_samples = int(self.psd_window_s * sr)
+                ready_channels = [ch for ch in sd["channels"] if len(ch["ring_buffer"]) >= window_samples]
+                if not ready_channels:
+                    continue
 
-                    # OPTIMIZED: Get recent data from ring buffer (efficient)
-                    _, y_buf = ch_info["ring_buffer"].get_data()
-                    psd_data_slice = y_buf[-int(self.psd_window_s * sr):].copy()
+                # OPTIMIZED: Stack the stream's channels and process/Welch them in one batched call
+                data_2d = np.stack([ch["ring_buffer"].get_data(max_items=window_samples)[1]
+                                    for ch in ready_channels])
 
-                    # Apply signal processing (from IXR-Suite)
-                    psd_data_slice = self._apply_signal_processing(psd_data_slice, sr)
+                # Apply signal processing (from IXR-Suite)
+                data_2d = self._apply_signal_processing(data_2d, sr)
 
-                    # Calculate PSD
-                    psd_data, bands = self._calculate_psd_and_bands(psd_data_slice, sr)
+                # Calculate PSD
+                psd_data, bands = self._calculate_psd_and_bands(data_2d, sr)
+                if psd_data is None:
+                    continue
 
-                    if psd_data is not None and psd_curve_idx < len(self.psd_curves):
-                        # Update PSD curve
-                        lim = min(60, len(psd_data[0]))
-                        self.psd_curves[psd_curve_idx].setData(psd_data[1][0:lim].tolist(), psd_data[0][0:lim].tolist())
-                        psd_curve_idx += 1
+                psd, freqs = psd_data
+                # Display up to 60 Hz; freqs is ascending, so that is a leading slice
+                lim = np.count_nonzero(freqs <= 60.0)
+                for psd_row in psd:
+                    if psd_curve_idx >= len(self.psd_curves):
+                        break
+                    # Update PSD curve
+                    self.psd_curves[psd_curve_idx].setData(freqs[:lim], psd_row[:lim])
+                    psd_curve_idx += 1
 
             # Reset counter after PSD update
             self.psd_update_counter = 0
@@ -746,6 +852,27 @@ class PlotTab(QWidget):
         # self.t2 = time.perf_counter(), time.process_time()
         # print(f" Time update_plot(): {self.t2[0] - self.t1[0]:.2f} seconds")
 
+    def _pull_chunk(self, sd):
+        """
+        Pull the next chunk from a stream's inlet as (timestamps, samples) arrays.
+
+        Float streams are written straight into the stream's preallocated pull
+        buffer; the returned samples are a view into it and are only valid until
+        the next pull. Other formats fall back to pylsl's list conversion.
+        Returns (None, None) when no new samples are available.
+        """
+        pull_buf = sd.get("pull_buf")
+        if pull_buf is None:
+            samples, timestamps = sd["inlet"].pull_chunk(timeout=0.0, max_samples=self.max_chunk)
+            if not timestamps:
+                return None, None
+            return np.array(timestamps, dtype=np.float64), np.array(samples, dtype=np.float32)
+
+        _, timestamps = sd["inlet"].pull_chunk(timeout=0.0, max_samples=len(pull_buf), dest_obj=pull_buf)
+        if not timestamps:
+            return None, None
+        return np.array(timestamps, dtype=np.float64), pull_buf[:len(timestamps)]
+
     def set_visible(self, visible):
         """
         Set visibility state for optimization.
@@ -771,24 +898,23 @@ class PlotTab(QWidget):
             chan = chan.next_sibling("channel")
         return names
 
-    def _prefill_stream_buffers(self, inlet, channels_list):
+    def _prefill_stream_buffers(self, sd):
         """
         OPTIMIZED: Pre-fill ring buffers with initial data for instant visualization.
         This pulls available data immediately when a stream is added.
         """
         print("[PREFILL] Pre-filling ring buffers for instant display...")
 
+        channels_list = sd["channels"]
+
         # Pull whatever data is available (non-blocking)
-        samples, timestamps = inlet.pull_chunk(timeout=0.0)
+        t_arr, s_arr = self._pull_chunk(sd)
 
-        if not timestamps:
+        if t_arr is None:
             print("[PREFILL] No initial data available yet")
             return
 
-        t_arr = np.array(timestamps, dtype=np.float64)
-        s_arr = np.array(samples, dtype=np.float64)
-
-        print(f"[PREFILL] Pre-filled {len(timestamps)} samples across {len(channels_list)} channels")
+        print(f"[PREFILL] Pre-filled {len(t_arr)} samples across {len(channels_list)} channels")
 
         # Fill each channel's ring buffer with RAW data (filtering happens on display)
         for ch_idx, ch_info in enumerate(channels_list):
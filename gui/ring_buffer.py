@@ -30,8 +30,12 @@ class RingBuffer:
         Args:
             data: Array-like data to append
         """
-        data = np.asarray(data, dtype=self.dtype)
+        # Skip the conversion when the caller already passes a matching contiguous array
+        if not (isinstance(data, np.ndarray) and data.dtype == self.dtype and data.flags.c_contiguous):
+            data = np.asarray(data, dtype=self.dtype)
         n = len(data)
+        if n == 0:
+            return
 
         if n >= self.capacity:
             # If data is larger than capacity, only keep the most recent elements
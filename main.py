@@ -1,21 +1,33 @@
 # main.py
 
+import os
 import sys
 import logging
 from PyQt5.QtWidgets import QApplication
+from PyQt5.QtCore import QTimer
+
+from src.common.utils.platform_helper import PlatformInfo, BluetoothHelper
+
+# --no-bluetooth skips the Bluetooth probes (diagnostics and startup checks). It is
+# applied before the imports below because they initialize logging, and logging
+# initialization runs the platform diagnostics.
+if '--no-bluetooth' in sys.argv:
+    sys.argv.remove('--no-bluetooth')
+    os.environ[BluetoothHelper.SKIP_CHECK_ENV_VAR] = '1'
 
 from gui.dashboard import MainWindow
 
 # Import new architecture components
 from src.common.utils.service_container import get_container
 from src.common.utils.logger import get_logger, LoggerSetup
-from src.common.utils.platform_helper import PlatformInfo, BluetoothHelper
 from src.infrastructure.sensors.sensor_factory import SensorFactory
 from src.application.services.sensor_service import SensorService
 from src.application.services.streaming_service import StreamingService
 from src.application.services.analysis_service import AnalysisService
 from src.application.services.signal_processor import BrainFlowSignalProcessor
 
+logger = get_logger(__name__)
+
 
 def bootstrap_services():
     """
@@ -24,7 +36,6 @@ def bootstrap_services():
     This sets up the application architecture by registering all services
     in the DI container for later resolution.
     """
-    logger = get_logger(__name__)
     logger.info("Bootstrapping services...")
 
     container = get_container()
@@ -34,21 +45,17 @@ def bootstrap_services():
     container.register_singleton(SensorFactory, sensor_factory)
     logger.debug("Registered SensorFactory")
 
-    # Register services
-    sensor_service = SensorService(sensor_factory)
-    container.register_singleton(SensorService, sensor_service)
+    # Register services (built on first resolve, not at startup)
+    container.register_singleton_factory(SensorService, lambda sf=sensor_factory: SensorService(sf))
     logger.debug("Registered SensorService")
 
-    streaming_service = StreamingService()
-    container.register_singleton(StreamingService, streaming_service)
+    container.register_singleton_factory(StreamingService, StreamingService)
     logger.debug("Registered StreamingService")
 
-    analysis_service = AnalysisService()
-    container.register_singleton(AnalysisService, analysis_service)
+    container.register_singleton_factory(AnalysisService, AnalysisService)
     logger.debug("Registered AnalysisService")
 
-    signal_processor = BrainFlowSignalProcessor()
-    container.register_singleton(BrainFlowSignalProcessor, signal_processor)
+    container.register_singleton_factory(BrainFlowSignalProcessor, BrainFlowSignalProcessor)
     logger.debug("Registered SignalProcessor")
 
     logger.info("Services bootstrapped successfully")
@@ -92,6 +99,19 @@ def perform_startup_checks(logger):
     logger.info("Startup checks completed")
 
 
+def _should_skip_bluetooth_check():
+    """
+    Check whether the startup Bluetooth probe can be skipped.
+
+    The probe only matters for the BLE sensor path (Polar H10); the user can
+    disable it with --no-bluetooth / IXR_SKIP_BT_CHECK.
+
+    Returns:
+        bool: True if the Bluetooth probe should not run
+    """
+    return BluetoothHelper.is_check_skipped()
+
+
 def _check_windows_compatibility(logger):
     """Windows-specific compatibility checks."""
     # Check Windows version
@@ -106,6 +126,10 @@ def _check_windows_compatibility(logger):
     except Exception as e:
         logger.debug(f"Could not detect Windows version: {e}")
 
+    if _should_skip_bluetooth_check():
+        logger.info("Bluetooth check skipped")
+        return
+
     # Check Bluetooth availability
     bt_available, bt_error = BluetoothHelper.check_bluetooth_available()
     if not bt_available:
@@ -129,6 +153,10 @@ def _check_mac_compatibility(logger):
     except Exception as e:
         logger.debug(f"Could not detect macOS version: {e}")
 
+    if _should_skip_bluetooth_check():
+        logger.info("Bluetooth check skipped")
+        return
+
     # Check Bluetooth availability
     bt_available, bt_error = BluetoothHelper.check_bluetooth_available()
     if not bt_available:
@@ -139,6 +167,12 @@ def _check_mac_compatibility(logger):
 
 def _check_linux_compatibility(logger):
     """Linux-specific compatibility checks."""
+    # Headless runs (CI, no display server) have no use for these probes, and
+    # bluetoothctl can stall without a session bus
+    if os.environ.get('CI') or not (os.environ.get('DISPLAY') or os.environ.get('WAYLAND_DISPLAY')):
+        logger.info("Skipping Linux compatibility checks in headless environment")
+        return
+
     try:
         import platform
         linux_dist = platform.freedesktop_os_release()
@@ -147,6 +181,10 @@ def _check_linux_compatibility(logger):
     except Exception as e:
         logger.debug(f"Could not detect Linux distribution: {e}")
 
+    if _should_skip_bluetooth_check():
+        logger.info("Bluetooth check skipped")
+        return
+
     # Check Bluetooth availability
     bt_available, bt_error = BluetoothHelper.check_bluetooth_available()
     if not bt_available:
@@ -168,7 +206,6 @@ def main():
         console_output=True
     )
 
-    logger = get_logger(__name__)
     logger.info("=" * 60)
     logger.info("IXR EEG Suite Starting...")
     logger.info("=" * 60)
@@ -190,6 +227,9 @@ def main():
         window.show()
         logger.info("Main window displayed")
 
+        # Build the heavier tabs after the first paint
+        QTimer.singleShot(0, window.populate_tabs)
+
         # Start event loop
         logger.info("Starting Qt event loop...")
         exit_code = app.exec_()
@@ -7,10 +7,15 @@ between layers of the application.
 
 from dataclasses import dataclass
 from typing import List, Dict, Optional
+import sys
 import numpy as np
 
+# Per-result DTOs are created at the analysis update rate; slots drop the
+# per-instance __dict__ where the running Python supports them (3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class BandPowerData:
     """
     Brain power data for a specific EEG frequency band.
@@ -27,7 +32,7 @@ class BandPowerData:
     power_normalized: float = 0.0
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class BrainPowerResult:
     """
     Complete brain power analysis result.
@@ -52,7 +57,7 @@ class BrainPowerResult:
     channel_states: Optional[Dict[str, str]] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class FocusMetrics:
     """
     Focus analysis metrics.
@@ -73,7 +78,7 @@ class FocusMetrics:
     relaxation: float = 0.0
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class AnalysisSettings:
     """
     Configuration settings for analysis.
@@ -116,7 +121,7 @@ class AnalysisSettings:
         return cls(**data)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class StreamData:
     """
     LSL stream data sample.
@@ -124,8 +129,8 @@ class StreamData:
     Attributes:
         stream_name: Name of the LSL stream
         stream_type: Type of the stream (e.g., "EEG", "Gyro")
-        samples: Array of data samples (channels x samples)
-        timestamps: Array of timestamps for each sample
+        samples: float32 array of data samples (channels x samples)
+        timestamps: float64 array of timestamps for each sample
         channel_count: Number of channels
         sampling_rate: Nominal sampling rate in Hz
     """
@@ -136,13 +141,20 @@ class StreamData:
     channel_count: int
     sampling_rate: float
 
+    def __post_init__(self):
+        # Analysis does not need float64 samples; float32 halves the memory traffic
+        # of every downstream kernel. Timestamps stay float64 for sub-ms resolution.
+        # No copy is made when the producer already supplies these dtypes.
+        self.samples = np.asarray(self.samples, dtype=np.float32)
+        self.timestamps = np.asarray(self.timestamps, dtype=np.float64)
+
     @property
     def sample_count(self) -> int:
         """Get the number of samples."""
         return self.samples.shape[1] if len(self.samples.shape) > 1 else len(self.samples)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class SensorData:
     """
     Raw sensor data from hardware.
@@ -151,8 +163,8 @@ class SensorData:
         sensor_type: Type of sensor (e.g., "Muse", "Polar H10")
         sensor_id: Unique identifier for the sensor
         data_type: Type of data (e.g., "EEG", "ECG", "Gyro")
-        samples: Array of data samples
-        timestamps: Array of timestamps
+        samples: float32 array of data samples
+        timestamps: float64 array of timestamps
         channel_names: List of channel names
         sampling_rate: Sampling rate in Hz
         metadata: Additional metadata dictionary
@@ -166,8 +178,13 @@ class SensorData:
     sampling_rate: float
     metadata: Optional[Dict] = None
 
+    def __post_init__(self):
+        # Same dtypes as StreamData: float32 samples, float64 timestamps
+        self.samples = np.asarray(self.samples, dtype=np.float32)
+        self.timestamps = np.asarray(self.timestamps, dtype=np.float64)
+
 
-@dataclass
+@dataclass(**_SLOTS)
 class AnalysisStatus:
     """
     Status information for an analysis process.
@@ -5,8 +5,10 @@ This service provides high-level API for managing analysis workflows,
 coordinating data processing, and publishing analysis results.
 """
 
-from typing import Dict, Optional, Any
-from PyQt5.QtCore import QObject, pyqtSignal, QThread
+from threading import Event, Lock
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Mapping, Optional, Protocol
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal, QThread
 import logging
 
 from src.domain.interfaces.i_analysis_service import IAnalysisService
@@ -27,6 +29,40 @@ from src.common.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+RESULT_PUBLISH_INTERVAL_MS = 20  # Results arriving faster than this are coalesced
+
+
+def _positive_number(key: str) -> Callable[[Any], None]:
+    """Build a validator requiring a positive int or float for key."""
+    def validate(value: Any) -> None:
+        if not isinstance(value, (int, float)) or value <= 0:
+            raise ValueError(f"{key} must be a positive number")
+    return validate
+
+
+def _one_of(key: str, choices: list) -> Callable[[Any], None]:
+    """Build a validator requiring the value of key to be one of choices."""
+    def validate(value: Any) -> None:
+        if value not in choices:
+            raise ValueError(f"{key} must be one of {choices}")
+    return validate
+
+
+# Validator per settings key; keys without an entry are accepted as is
+_SETTINGS_VALIDATORS: Dict[str, Callable[[Any], None]] = {
+    "calib_length": _positive_number("calib_length"),
+    "power_length": _positive_number("power_length"),
+    "scale": _positive_number("scale"),
+    "reference": _one_of("reference", ["mean", "median", "none"]),
+}
+
+
+class AnalysisWorkerProtocol(Protocol):
+    """Signals an analysis worker must provide to be attached with set_worker."""
+
+    analysisUpdated: Any  # pyqtSignal carrying analysis results
+    statusUpdated: Any  # pyqtSignal(str) carrying status messages
+
 
 class AnalysisService(IAnalysisService):
     """
@@ -54,11 +90,23 @@ class AnalysisService(IAnalysisService):
     def __init__(self):
         """Initialize the analysis service."""
         super().__init__()
-        self._is_running = False
+        self._is_running = Event()  # Set while analysis runs; safe to read from any thread
         self._settings = AnalysisDefaults.DEFAULT_SETTINGS.copy()
+        self._settings_view = MappingProxyType(dict(self._settings))
+        self._analysis_type = self._settings.get("analysis_type", "brain_power")
         self._worker = None
         self._worker_thread = None
         self._event_bus = get_event_bus()
+
+        # Latest unpublished results; a burst of updates is delivered once, newest wins.
+        # publish_analysis_results may run on any thread, so it only stores the results
+        # under the lock; the timer, started here on the service's own thread, emits them.
+        self._pending_results: Optional[Dict[str, Any]] = None
+        self._pending_lock = Lock()
+        self._publish_timer = QTimer(self)
+        self._publish_timer.setInterval(RESULT_PUBLISH_INTERVAL_MS)
+        self._publish_timer.timeout.connect(self._flush_analysis_results)
+        self._publish_timer.start()
         logger.info("AnalysisService initialized")
 
     def start_analysis(self, settings: Optional[Dict] = None) -> None:
@@ -72,7 +120,7 @@ class AnalysisService(IAnalysisService):
         Raises:
             AnalysisException: If analysis cannot be started
         """
-        if self._is_running:
+        if self._is_running.is_set():
             logger.warning("Analysis already running")
             return
 
@@ -80,24 +128,26 @@ class AnalysisService(IAnalysisService):
             # Update settings if provided
             if settings:
                 self._settings.update(settings)
+                self._refresh_settings_view()
 
-            logger.info(f"Starting analysis with settings: {self._settings}")
+            # Lazy %-formatting: the settings dict is only rendered if INFO is enabled
+            logger.info("Starting analysis with settings: %s", self._settings)
 
             # Mark as running
-            self._is_running = True
+            self._is_running.set()
 
             # Emit signals
             self.analysis_started.emit()
             self.status_updated.emit("Analysis started")
 
             # Publish event
-            event = AnalysisStartedEvent(self._settings.get("analysis_type", "brain_power"))
+            event = AnalysisStartedEvent(self._analysis_type)
             self._event_bus.publish(event)
 
             logger.info("Analysis started successfully")
 
         except Exception as e:
-            self._is_running = False
+            self._is_running.clear()
             error_msg = f"Failed to start analysis: {str(e)}"
             logger.error(error_msg, exc_info=True)
 
@@ -117,7 +167,7 @@ class AnalysisService(IAnalysisService):
         Raises:
             AnalysisNotRunningError: If analysis is not running
         """
-        if not self._is_running:
+        if not self._is_running.is_set():
             logger.warning("Analysis not running")
             return
 
@@ -132,14 +182,14 @@ class AnalysisService(IAnalysisService):
                 self._worker_thread.wait()
 
             # Mark as stopped
-            self._is_running = False
+            self._is_running.clear()
 
             # Emit signals
             self.analysis_stopped.emit()
             self.status_updated.emit("Analysis stopped")
 
             # Publish event
-            event = AnalysisStoppedEvent(self._settings.get("analysis_type", "brain_power"))
+            event = AnalysisStoppedEvent(self._analysis_type)
             self._event_bus.publish(event)
 
             logger.info("Analysis stopped successfully")
@@ -156,16 +206,21 @@ class AnalysisService(IAnalysisService):
         Returns:
             bool: True if analysis is running, False otherwise
         """
-        return self._is_running
+        return self._is_running.is_set()
 
-    def get_settings(self) -> Dict:
+    def get_settings(self) -> Mapping:
         """
         Get the current analysis settings.
 
         Returns:
-            Dict: Current analysis configuration
+            Mapping: Read-only snapshot of the current analysis configuration
         """
-        return self._settings.copy()
+        return self._settings_view
+
+    def _refresh_settings_view(self) -> None:
+        """Rebuild the read-only snapshot and cached values derived from the settings."""
+        self._settings_view = MappingProxyType(dict(self._settings))
+        self._analysis_type = self._settings.get("analysis_type", "brain_power")
 
     def update_settings(self, settings: Dict) -> None:
         """
@@ -181,17 +236,24 @@ class AnalysisService(IAnalysisService):
             # Validate settings
             self._validate_settings(settings)
 
+            # Only keys whose value actually changes count; an update that changes
+            # nothing publishes nothing
+            delta = {k: v for k, v in settings.items() if self._settings.get(k) != v}
+            if not delta:
+                logger.debug("Analysis settings unchanged, skipping update")
+                return
+
             # Update settings
-            old_settings = self._settings.copy()
-            self._settings.update(settings)
+            self._settings.update(delta)
+            self._refresh_settings_view()
 
-            logger.info(f"Updated analysis settings: {settings}")
+            logger.info("Updated analysis settings: %s", delta)
 
             # If analysis is running, emit update event
-            if self._is_running:
+            if self._is_running.is_set():
                 event = AnalysisUpdatedEvent(
-                    analysis_type=self._settings.get("analysis_type", "brain_power"),
-                    metrics={"settings_changed": True}
+                    analysis_type=self._analysis_type,
+                    metrics={"settings_changed": list(delta)}
                 )
                 self._event_bus.publish(event)
 
@@ -209,16 +271,30 @@ class AnalysisService(IAnalysisService):
         """
         Publish analysis results.
 
+        Results are delivered at most once per RESULT_PUBLISH_INTERVAL_MS;
+        if several arrive within one interval, only the newest is published.
+        Safe to call from any thread: delivery happens on the service's thread.
+
         Args:
             results: Dictionary containing analysis results
         """
+        with self._pending_lock:
+            self._pending_results = results
+
+    def _flush_analysis_results(self) -> None:
+        """Emit the newest pending analysis results to subscribers."""
+        with self._pending_lock:
+            results = self._pending_results
+            self._pending_results = None
+        if results is None:
+            return
         try:
             # Emit signal with results
             self.analysis_updated.emit(results)
 
             # Publish event
             event = AnalysisUpdatedEvent(
-                analysis_type=self._settings.get("analysis_type", "brain_power"),
+                analysis_type=self._analysis_type,
                 metrics=results
             )
             self._event_bus.publish(event)
@@ -226,7 +302,7 @@ class AnalysisService(IAnalysisService):
         except Exception as e:
             logger.error(f"Error publishing analysis results: {e}")
 
-    def set_worker(self, worker: QObject, thread: QThread) -> None:
+    def set_worker(self, worker: AnalysisWorkerProtocol, thread: QThread) -> None:
         """
         Set the worker and thread for analysis.
 
@@ -237,11 +313,9 @@ class AnalysisService(IAnalysisService):
         self._worker = worker
         self._worker_thread = thread
 
-        # Connect worker signals
-        if hasattr(worker, 'analysisUpdated'):
-            worker.analysisUpdated.connect(self.publish_analysis_results)
-        if hasattr(worker, 'statusUpdated'):
-            worker.statusUpdated.connect(lambda msg: self.status_updated.emit(msg))
+        # Connect worker signals (signal-to-signal, no Python slot in between)
+        worker.analysisUpdated.connect(self.publish_analysis_results)
+        worker.statusUpdated.connect(self.status_updated)
 
         logger.debug("Worker and thread set for analysis service")
 
@@ -264,31 +338,22 @@ class AnalysisService(IAnalysisService):
         Raises:
             ValueError: If settings are invalid
         """
-        # Validate required fields if present
-        if "calib_length" in settings:
-            if not isinstance(settings["calib_length"], (int, float)) or settings["calib_length"] <= 0:
-                raise ValueError("calib_length must be a positive number")
-
-        if "power_length" in settings:
-            if not isinstance(settings["power_length"], (int, float)) or settings["power_length"] <= 0:
-                raise ValueError("power_length must be a positive number")
-
-        if "scale" in settings:
-            if not isinstance(settings["scale"], (int, float)) or settings["scale"] <= 0:
-                raise ValueError("scale must be a positive number")
-
-        if "reference" in settings:
-            valid_refs = ["mean", "median", "none"]
-            if settings["reference"] not in valid_refs:
-                raise ValueError(f"reference must be one of {valid_refs}")
+        # Validate the fields that are present
+        for key, value in settings.items():
+            validate = _SETTINGS_VALIDATORS.get(key)
+            if validate is not None:
+                validate(value)
 
     def cleanup(self) -> None:
         """Cleanup the service and stop any running analysis."""
         logger.info("Cleaning up AnalysisService")
 
-        if self._is_running:
+        if self._is_running.is_set():
             self.stop_analysis()
 
+        self._publish_timer.stop()
+        with self._pending_lock:
+            self._pending_results = None
         self._worker = None
         self._worker_thread = None
 
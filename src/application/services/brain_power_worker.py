@@ -5,9 +5,16 @@ This worker thread performs brain power analysis based on the original IXR Suite
 Uses BrainFlow directly (not LSL) to match original implementation.
 """
 
+import logging
+import math
+import time
+from collections import deque
+from threading import Event
+
 import numpy as np
 from PyQt5.QtCore import QThread, pyqtSignal
-from scipy.signal import butter, filtfilt, welch
+from scipy.fft import next_fast_len
+from scipy.signal import butter, get_window, sosfilt, sosfilt_zi, sosfiltfilt, welch
 from dataclasses import dataclass
 from brainflow import BoardShim, BrainFlowPresets, BrainFlowError, BrainFlowExitCodes
 
@@ -15,6 +22,138 @@ from src.common.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Per-tick result lines are logged at INFO only every this many ticks (~1 s at 40 ms)
+RESULT_LOG_EVERY = 25
+
+
+def _brain_metrics(theta, alpha, beta, gamma):
+    """
+    Compute the channel-averaged engagement and inverse workload indices.
+
+    Matches the original formulas; channels failing the guards contribute 0
+    but still count towards the average. Only guarded channels are divided,
+    so no NaN/inf temporaries are produced.
+
+    Returns:
+        Tuple (engagement_idx, inverse_workload_idx) as floats
+    """
+    theta_alpha = theta + alpha
+    valid = (theta_alpha > 0) & (gamma > 0)
+
+    engagement = np.zeros_like(beta)
+    np.divide(beta, theta_alpha, out=engagement, where=valid)
+    np.divide(engagement, gamma, out=engagement, where=valid)
+
+    valid &= theta > 0
+    inverse_workload = np.zeros_like(alpha)
+    np.divide(alpha, theta, out=inverse_workload, where=valid)
+    np.divide(inverse_workload, gamma, out=inverse_workload, where=valid)
+
+    return float(engagement.mean()), float(inverse_workload.mean())
+
+
+class _RunningWindow:
+    """
+    Sliding window of the last ``maxlen`` values with a running sum and sum of squares.
+
+    Keeps mean/std O(1) per update instead of rescanning the whole calibration
+    window every tick. The moments are recomputed exactly once per ``maxlen``
+    appends so add/subtract rounding cannot drift over long sessions.
+    """
+
+    __slots__ = ("_values", "_sum", "_sumsq", "_appends")
+
+    def __init__(self, maxlen, initial=()):
+        self._values = deque(maxlen=max(1, maxlen))
+        self._sum = 0.0
+        self._sumsq = 0.0
+        self._appends = 0
+        for value in initial:
+            self.append(value)
+
+    def append(self, value):
+        value = float(value)
+        values = self._values
+        if len(values) == values.maxlen:
+            oldest = values[0]
+            self._sum -= oldest
+            self._sumsq -= oldest * oldest
+        values.append(value)
+        self._sum += value
+        self._sumsq += value * value
+
+        self._appends += 1
+        if self._appends >= values.maxlen:
+            self._appends = 0
+            self._sum = math.fsum(values)
+            self._sumsq = math.fsum(v * v for v in values)
+
+    def mean(self):
+        return self._sum / len(self._values)
+
+    def std(self):
+        """Population standard deviation (same as np.std with ddof=0)."""
+        mean = self.mean()
+        return math.sqrt(max(0.0, self._sumsq / len(self._values) - mean * mean))
+
+    def __len__(self):
+        return len(self._values)
+
+    def __iter__(self):
+        return iter(self._values)
+
+
+class _HistoryRing:
+    """
+    Fixed-size NumPy ring of the latest scores for the linearly weighted mean.
+
+    The weighted mean is two dot products over the contiguous halves of the ring
+    against weights precomputed once, so nothing is copied or converted per tick.
+    """
+
+    __slots__ = ("_buf", "_weights", "_pos", "_count")
+
+    def __init__(self, size, initial=()):
+        size = max(1, size)
+        self._buf = np.zeros(size, dtype=np.float64)
+        self._weights = np.arange(size, dtype=np.float64)
+        self._pos = 0
+        self._count = 0
+        for value in initial:
+            self.append(value)
+
+    def append(self, value):
+        self._buf[self._pos] = value
+        self._pos = (self._pos + 1) % len(self._buf)
+        if self._count < len(self._buf):
+            self._count += 1
+
+    def weighted_mean(self):
+        """
+        Mean with weights increasing linearly from the oldest (0) to the newest (n-1)
+        value; the weight sum is the closed form n(n-1)/2.
+        """
+        n = self._count
+        if n < 2:
+            return 0
+        buf, weights = self._buf, self._weights
+        if n < len(buf):
+            weighted_sum = np.dot(weights[:n], buf[:n])
+        else:
+            # Oldest value sits at _pos: buf[_pos:] then buf[:_pos] in time order
+            split = n - self._pos
+            weighted_sum = np.dot(weights[:split], buf[self._pos:]) + np.dot(weights[split:], buf[:self._pos])
+        return float(weighted_sum) / (n * (n - 1) * 0.5)
+
+    def __len__(self):
+        return self._count
+
+    def __iter__(self):
+        """Values oldest first, so a ring can seed another (see set_parameters)."""
+        buf = self._buf
+        yield from buf[self._pos:self._count].tolist()
+        yield from buf[:self._pos].tolist()
+
 
 @dataclass
 class Channel:
@@ -44,6 +183,8 @@ class BrainPowerWorker(QThread):
         self.board_shim = board_shim
         self.board_id = board_shim.get_board_id()
         self._running = True
+        self._wake = Event()  # Set by stop() to cut the loop's wait short
+        self._deadline = 0.0  # Monotonic time of the current tick (fixed-rate schedule)
 
         # Get available presets for the specific board
         self.available_presets = BoardShim.get_board_presets(self.board_id)
@@ -96,7 +237,69 @@ class BrainPowerWorker(QThread):
         # Brain power metrics
         self.update_speed_ms = 40  # Update every 40ms for real-time (match original IXR-Suite)
         self.power_metric_window_s = 1.5
-        self.psd_size = 2**int(np.floor(np.log2(self.eeg_sr)))
+        # Window lengths in samples, fixed for the lifetime of the worker
+        self._eeg_win = int(self.power_metric_window_s * self.eeg_sr)
+        self._gyro_win = int(self.power_metric_window_s * self.gyro_sr)
+        # One-second Welch segment, rounded to a fast FFT length (256 for Muse; 250 Hz
+        # boards get 250-point segments, i.e. 1 Hz bins, instead of 128)
+        self.psd_size = next_fast_len(min(self._eeg_win, int(self.eeg_sr)), real=True)
+        # Welch window for the pinned segment length (reused every tick)
+        self._psd_window = get_window('hann', self.psd_size)
+
+        # Static channel index arrays (the channel list never changes after setup);
+        # per tick only the bad channels are removed from _non_ref_idx
+        self._non_ref_channels = tuple(ch for ch in self.eeg_channels if not ch.reference)
+        self._non_ref_idx = np.array(
+            [ch.ch_number for ch in self._non_ref_channels], dtype=np.intp
+        )
+        self._ref_idx = np.array(
+            [ch.ch_number for ch in self.eeg_channels if ch.reference], dtype=np.intp
+        )
+        self._good_idx_memo = (None, self._non_ref_idx)
+
+        # Preallocated float32 work buffers for the (channels, window) EEG blocks of
+        # the bad-channel check and the band-power step
+        self._eeg_block = np.empty(
+            (len(self._non_ref_idx), self._eeg_win),
+            dtype=np.float32
+        )
+        self._bad_block = np.empty_like(self._eeg_block)
+
+        # Filter design cache: (sr, bp_low, bp_high, notch_low, notch_high) -> (sos_bp, sos_notch)
+        self._filter_cache = {}
+
+        # Band membership matrices: (sr, nperseg) -> (5, n_freqs) 0/1 matrix
+        self._band_matrix_cache = {}
+
+        # Line-noise (45-55 Hz, exclusive) Welch bins: (sr, nperseg) -> slice
+        self._line_slice_cache = {}
+
+        # Bad-channel amplitude check filters (15 Hz highpass, 45 Hz lowpass), designed
+        # once; None when the cutoff is at or above Nyquist (that stage is skipped)
+        self._sos_bad_hp = self._design_first_order(15, 'high')
+        self._sos_bad_lp = self._design_first_order(45, 'low')
+        # Zero-phase (sosfiltfilt) by default, which the amplitude thresholds were tuned
+        # for; "zero_phase": False runs each stage once, causally, primed with sosfilt_zi
+        self._bad_zero_phase = settings.get("zero_phase", True)
+        self._bad_filters = tuple(
+            (sos, sosfilt_zi(sos)) for sos in (self._sos_bad_hp, self._sos_bad_lp) if sos is not None
+        )
+
+        # Persistent ring of bandpass+notch filtered EEG (rows indexed by ch_number,
+        # oldest sample first). Only samples newer than _last_ts are filtered each
+        # tick, with the sosfilt state carried over in _ring_zi.
+        sos_bp, sos_notch = self._get_filters(self.eeg_sr)
+        self._ring_sos = sos_bp if sos_notch is None else np.vstack([sos_bp, sos_notch])
+        self._ts_channel = BoardShim.get_timestamp_channel(self.board_id, self.eeg_preset)
+        self._eeg_rows = np.array([ch.ch_number for ch in self.eeg_channels], dtype=np.intp)
+        self._eeg_ring = np.zeros(
+            (int(self._eeg_rows.max()) + 1, self._eeg_win),
+            dtype=np.float32
+        )
+        self._ring_out = np.zeros_like(self._eeg_ring)
+        self._ring_fill = 0
+        self._ring_zi = None
+        self._last_ts = None
 
         # Calibration and history
         self.inverse_workload_calib = [0, 1]
@@ -107,6 +310,8 @@ class BrainPowerWorker(QThread):
         self.engagement = 0
         self.power_metrics = 0
         self.longerterm_hist = [0]
+        self._tick = 0
+        self._last_bad_channels = ()
 
         # Parameters (will be set from settings)
         self.calib_length = 0
@@ -121,6 +326,14 @@ class BrainPowerWorker(QThread):
         self.calib_length = int(self.settings["calib_length"] * 1000 / self.update_speed_ms)
         self.hist_length = int(self.settings["power_length"] * 1000 / self.update_speed_ms)
         self.longerterm_length = int(self.settings["longerterm_length"] * 1000 / self.update_speed_ms)
+
+        # Bounded buffers replace the list + del [0] trimming; the history holds one
+        # extra entry because it used to be trimmed before the new score was appended
+        self.engagement_calib = _RunningWindow(self.calib_length, self.engagement_calib)
+        self.inverse_workload_calib = _RunningWindow(self.calib_length, self.inverse_workload_calib)
+        self.engagement_hist = _HistoryRing(self.hist_length + 1, self.engagement_hist)
+        self.inverse_workload_hist = _HistoryRing(self.hist_length + 1, self.inverse_workload_hist)
+        self.longerterm_hist = _RunningWindow(self.longerterm_length, self.longerterm_hist)
         self.brain_scale = self.settings["scale"]
         self.brain_center = self.settings["offset"]
         self.head_impact = self.settings["head_impact"]
@@ -139,7 +352,7 @@ class BrainPowerWorker(QThread):
         # Wait for board to be prepared
         while self._running and not self.board_shim.is_prepared():
             logger.debug("Waiting for board to be prepared...")
-            self.msleep(500)
+            self._wake.wait(0.5)
 
         if not self._running:
             logger.info("Stopped before board was ready")
@@ -148,6 +361,7 @@ class BrainPowerWorker(QThread):
         logger.info("Board is ready! Entering main processing loop...")
         self.statusUpdated.emit("Running...")
 
+        self._deadline = time.monotonic()
         while self._running:
             try:
                 # Check if board is still prepared
@@ -159,40 +373,40 @@ class BrainPowerWorker(QThread):
                 # Pull EEG data directly from BrainFlow (like original implementation)
                 try:
                     eeg_data = self.board_shim.get_current_board_data(
-                        int(self.power_metric_window_s * self.eeg_sr),
-                        self.eeg_preset
+                        self._eeg_win, self.eeg_preset
                     )
                 except BrainFlowError as e:
                     # Right after board preparation, connection might be unstable
                     if e.exit_code == BrainFlowExitCodes.INVALID_ARGUMENTS_ERROR:
-                        self.msleep(self.update_speed_ms)
+                        self._wait_next_tick()
                         continue
                     else:
                         raise e
 
                 # Check if we got enough data
                 if len(eeg_data) < 1 or eeg_data.shape[1] < int(0.5 * self.eeg_sr):
-                    logger.debug(f"Not enough EEG data yet (got {eeg_data.shape[1] if len(eeg_data) > 0 else 0} samples)")
+                    logger.debug("Not enough EEG data yet (got %d samples)", eeg_data.shape[1] if len(eeg_data) > 0 else 0)
                     self.statusUpdated.emit("Accumulating EEG data...")
-                    self.msleep(self.update_speed_ms)
+                    self._wait_next_tick()
                     continue
 
-                logger.debug(f"Got EEG data with shape {eeg_data.shape}")
+                logger.debug("Got EEG data with shape %s", eeg_data.shape)
 
                 # Pull GYRO data if available
                 head_movement = 0
                 if self.gyro_channels:
                     try:
-                        gyro_data = self.board_shim.get_current_board_data(
-                            int(self.power_metric_window_s * self.gyro_sr),
-                            self.gyro_preset
-                        )
+                        gyro_data = self.board_shim.get_current_board_data(self._gyro_win, self.gyro_preset)
 
                         if len(gyro_data) > 0 and gyro_data.shape[1] > 0:
-                            # Calculate head movement (match original)
-                            gyro_slice = gyro_data[:, -int(self.power_metric_window_s * self.gyro_sr):]
-                            head_movement = np.clip(np.mean(np.abs(gyro_slice)) / 50, 0, 1)
-                            logger.debug(f"GYRO head_movement={head_movement:.3f}")
+                            # Calculate head movement (match original). BrainFlow already
+                            # returns at most _gyro_win samples, so no further slicing is
+                            # needed; gyro_data is our own copy, so take |x| in place (no
+                            # temporary). The mean of absolute values is never negative,
+                            # so only clip the top
+                            np.abs(gyro_data, out=gyro_data)
+                            head_movement = min(float(gyro_data.mean()) / 50, 1.0)
+                            logger.debug("GYRO head_movement=%.3f", head_movement)
                     except BrainFlowError as e:
                         if e.exit_code == BrainFlowExitCodes.INVALID_ARGUMENTS_ERROR:
                             pass  # Not critical, just skip GYRO this iteration
@@ -202,19 +416,25 @@ class BrainPowerWorker(QThread):
                 # Perform bad channel detection (on the power metric window)
                 logger.debug("Detecting bad channels...")
                 bad_channels = self._detect_bad_channels(eeg_data)
-                logger.info(f"Bad channels detected: {[ch.name for ch in bad_channels]}")
-
-                # Re-reference EEG
-                logger.debug(f"Re-referencing EEG (method={self.settings['reference']})")
+                if bad_channels != self._last_bad_channels:
+                    # Only log changes; the set is usually stable from tick to tick
+                    logger.info("Bad channels detected: %s", [ch.name for ch in bad_channels])
+                    self._last_bad_channels = bad_channels
+
+                # Filter the new samples into the EEG ring, then re-reference the filtered
+                # window (filtering is linear, so the order does not change the result)
+                eeg_data = self._update_filtered_ring(eeg_data)
+                logger.debug("Re-referencing EEG (method=%s)", self.settings['reference'])
                 eeg_data = self._rereference_eeg(eeg_data, bad_channels)
 
                 # Process EEG and calculate brain metrics
                 logger.debug("Calculating brain metrics...")
                 avg_bands, engagement_idx, inverse_workload_idx = self._process_eeg(eeg_data, bad_channels)
-                logger.debug(f"Bands={[f'{b:.2f}' for b in avg_bands]}, engagement={engagement_idx:.3f}, inverse_workload={inverse_workload_idx:.3f}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Bands={[f'{b:.2f}' for b in avg_bands]}, engagement={engagement_idx:.3f}, inverse_workload={inverse_workload_idx:.3f}")
 
                 # Update calibration and history
-                num_good_channels = len([ch for ch in self.eeg_channels if not ch.reference and ch not in bad_channels])
+                num_good_channels = len(self._good_channel_idx(bad_channels))
 
                 if num_good_channels > 0:
                     # Only use valid scores to scale and calibrate
@@ -224,52 +444,41 @@ class BrainPowerWorker(QThread):
                     engagement_idx = 0
                     inverse_workload_idx = 0
 
-                # Limit lengths of history and calib
-                if len(self.engagement_calib) > self.calib_length:
-                    del self.engagement_calib[0]
-                if len(self.engagement_hist) > self.hist_length:
-                    del self.engagement_hist[0]
-                if len(self.inverse_workload_calib) > self.calib_length:
-                    del self.inverse_workload_calib[0]
-                if len(self.inverse_workload_hist) > self.hist_length:
-                    del self.inverse_workload_hist[0]
-
-                # Scale using z-score
-                engagement_z = (engagement_idx - np.mean(self.engagement_calib)) / (np.std(self.engagement_calib) + 1e-9)
+                # Scale using z-score (history and calib lengths are bounded by their buffers)
+                engagement_z = (engagement_idx - self.engagement_calib.mean()) / (self.engagement_calib.std() + 1e-9)
                 engagement_z /= 2 * self.brain_scale
                 engagement_z += self.brain_center
-                engagement_z = np.clip(engagement_z, 0.05, 1)
+                engagement_z = min(max(engagement_z, 0.05), 1.0)  # Scalar clip, no NumPy dispatch
                 self.engagement_hist.append(engagement_z)
 
-                inverse_workload_z = (inverse_workload_idx - np.mean(self.inverse_workload_calib)) / (np.std(self.inverse_workload_calib) + 1e-9)
+                inverse_workload_z = (inverse_workload_idx - self.inverse_workload_calib.mean()) / (self.inverse_workload_calib.std() + 1e-9)
                 inverse_workload_z /= 2 * self.brain_scale
                 inverse_workload_z += self.brain_center
-                inverse_workload_z = np.clip(inverse_workload_z, 0.05, 1)
+                inverse_workload_z = min(max(inverse_workload_z, 0.05), 1.0)
                 self.inverse_workload_hist.append(inverse_workload_z)
 
                 # Weighted mean
-                engagement_weighted_mean = self._compute_weighted_mean(self.engagement_hist)
-                inverse_workload_weighted_mean = self._compute_weighted_mean(self.inverse_workload_hist)
+                engagement_weighted_mean = self.engagement_hist.weighted_mean()
+                inverse_workload_weighted_mean = self.inverse_workload_hist.weighted_mean()
 
                 self.engagement = engagement_weighted_mean
                 self.inverse_workload = inverse_workload_weighted_mean
 
                 # Calculate short-term brainpower (match original)
-                short_term_brainpower = np.float32(self.engagement + (1 - head_movement) * self.head_impact)
+                short_term_brainpower = self.engagement + (1 - head_movement) * self.head_impact
 
-                # Update longer-term history
+                # Update longer-term history and its running average
                 self.longerterm_hist.append(short_term_brainpower)
-                if len(self.longerterm_hist) > self.longerterm_length:
-                    del self.longerterm_hist[0]
-
-                # Calculate longer-term average
-                longer_term_brainpower = np.mean(self.longerterm_hist)
+                longer_term_brainpower = self.longerterm_hist.mean()
 
                 # Final brainpower (match original)
-                final_brainpower = np.float32(max(short_term_brainpower, longer_term_brainpower))
+                final_brainpower = max(short_term_brainpower, longer_term_brainpower)
 
-                logger.info(f"Results: short={short_term_brainpower:.3f}, long={longer_term_brainpower:.3f}, final={final_brainpower:.3f}")
-                logger.info(f"Bands - Delta:{avg_bands[0]:.1f}, Theta:{avg_bands[1]:.1f}, Alpha:{avg_bands[2]:.1f}, Beta:{avg_bands[3]:.1f}, Gamma:{avg_bands[4]:.1f}")
+                self._tick += 1
+                if self._tick % RESULT_LOG_EVERY == 0:
+                    logger.info("Results: short=%.3f, long=%.3f, final=%.3f",
+                                short_term_brainpower, longer_term_brainpower, final_brainpower)
+                    logger.info("Bands - Delta:%.1f, Theta:%.1f, Alpha:%.1f, Beta:%.1f, Gamma:%.1f", *avg_bands)
 
                 # Emit results
                 self.analysisUpdated.emit(
@@ -281,72 +490,83 @@ class BrainPowerWorker(QThread):
 
                 # Update status periodically
                 if len(self.engagement_calib) % 50 == 0:
-                    self.statusUpdated.emit(f"Running ({num_good_channels}/{len([ch for ch in self.eeg_channels if not ch.reference])} good channels)")
+                    self.statusUpdated.emit(f"Running ({num_good_channels}/{len(self._non_ref_idx)} good channels)")
                     logger.info(f"Calib size={len(self.engagement_calib)}, Good channels={num_good_channels}")
 
             except Exception as e:
                 logger.error(f"Error in main loop: {str(e)}", exc_info=True)
                 self.statusUpdated.emit(f"Error: {str(e)}")
-                self.msleep(100)
+                self._wake.wait(0.1)
+                self._deadline = time.monotonic()
                 continue
 
-            self.msleep(self.update_speed_ms)
+            self._wait_next_tick()
+
+    def _wait_next_tick(self):
+        """
+        Wait until the next update on a fixed schedule.
+
+        The processing time is taken out of the wait, so ticks stay update_speed_ms
+        apart (which the calib/history lengths, counted in ticks, assume) instead of
+        update_speed_ms plus processing. stop() wakes the wait immediately.
+        """
+        period = self.update_speed_ms / 1000
+        self._deadline += period
+        delay = self._deadline - time.monotonic()
+        if delay > 0:
+            self._wake.wait(delay)
+        elif delay < -10 * period:
+            # Fell far behind (e.g. a slow BrainFlow call): resynchronise instead of
+            # running a burst of back-to-back ticks
+            self._deadline = time.monotonic()
 
     def _detect_bad_channels(self, eeg_data):
-        """Detect bad channels based on line noise and amplitude."""
-        bad_channels = []
-
-        def highpass(data, fs, cutoff):
-            nyq = 0.5 * fs
-            normal_cutoff = cutoff / nyq
-            if normal_cutoff >= 1.0:
-                return data
-            b, a = butter(1, normal_cutoff, btype='high', analog=False)
-            y = filtfilt(b, a, data)
-            return y
-
-        def lowpass(data, fs, cutoff):
-            nyq = 0.5 * fs
-            normal_cutoff = cutoff / nyq
-            if normal_cutoff >= 1.0:
-                return data
-            b, a = butter(1, normal_cutoff, btype='low', analog=False)
-            y = filtfilt(b, a, data)
-            return y
-
-        for eeg_channel in self.eeg_channels:
-            if eeg_channel.reference:
-                continue
-
-            if eeg_channel.ch_number >= eeg_data.shape[0]:
-                continue
-
-            # Take the power metric window (last N samples)
-            channel_data = eeg_data[eeg_channel.ch_number][-int(self.power_metric_window_s * self.eeg_sr):]
-
-            if len(channel_data) < 100:
-                continue
-
-            # Calculate power spectral density using welch
-            freq, psd = welch(channel_data, fs=self.eeg_sr, nperseg=min(256, len(channel_data)))
-
-            # Calculate line power
-            pow_line = np.mean(psd[(freq > 45) & (freq < 55)])
-            threshold_pow_line = 500
-
-            # Applying filters
-            filtered_data = highpass(channel_data, self.eeg_sr, 15)
-            filtered_data = lowpass(filtered_data, self.eeg_sr, 45)
-
-            # Checking the range
-            amplitude_range = np.ptp(filtered_data)
-            threshold_amplitude = 350
+        """
+        Detect bad channels based on line noise and amplitude (returned as a tuple).
+
+        All non-reference channels are checked at once: one batched welch for the
+        line power, the amplitude filters along axis 1 and the thresholds as masks.
+        """
+        # Take the power metric window (last N samples) of the non-reference channels
+        # as one float32 block; single precision is plenty for ~24-bit EEG and makes
+        # welch and the filters cheaper than on BrainFlow's float64 rows
+        window_data = eeg_data[:, -self._eeg_win:]
+        n_samples = window_data.shape[1]
+        present = self._non_ref_idx < eeg_data.shape[0]
+        channel_idx = self._non_ref_idx[present]
+        if n_samples < 100 or len(channel_idx) == 0:
+            return ()
+        block = self._bad_block[:len(channel_idx), :n_samples]
+        # eeg_data is BrainFlow's float64 array: narrow explicitly (np.take's out=
+        # must match the source dtype)
+        np.copyto(block, window_data[channel_idx], casting='same_kind')
+
+        # Calculate power spectral density using welch
+        nperseg = min(self.psd_size, n_samples)
+        _, psd = welch(block, fs=self.eeg_sr, nperseg=nperseg, axis=1)
+
+        # Calculate line power
+        pow_line = psd[:, self._get_line_slice(self.eeg_sr, nperseg)].mean(axis=1)
+        threshold_pow_line = 500
+
+        # Applying filters
+        filtered_data = block
+        for sos, zi in self._bad_filters:
+            if self._bad_zero_phase:
+                filtered_data = sosfiltfilt(sos, filtered_data, axis=1)
+            else:
+                filtered_data, _ = sosfilt(
+                    sos, filtered_data, axis=1, zi=zi[:, None, :] * filtered_data[:, :1]
+                )
 
-            # If either threshold exceeded, mark as bad
-            if pow_line > threshold_pow_line or amplitude_range > threshold_amplitude or amplitude_range < 5:
-                bad_channels.append(eeg_channel)
+        # Checking the range
+        amplitude_range = np.ptp(filtered_data, axis=1)
+        threshold_amplitude = 350
 
-        return bad_channels
+        # If either threshold exceeded, mark as bad
+        bad = (pow_line > threshold_pow_line) | (amplitude_range > threshold_amplitude) | (amplitude_range < 5)
+        channels = [ch for ch, ok in zip(self._non_ref_channels, present) if ok]
+        return tuple(channels[i] for i in np.flatnonzero(bad))
 
     def _rereference_eeg(self, eeg_data, bad_channels):
         """Re-reference EEG data based on settings (match original)."""
@@ -354,111 +574,189 @@ class BrainPowerWorker(QThread):
 
         if reference == 'mean':
             # Mean of good EEG channels
-            good_eeg_idx = [ch.ch_number for ch in self.eeg_channels if not ch.reference and ch not in bad_channels]
+            good_eeg_idx = self._good_channel_idx(bad_channels)
             if len(good_eeg_idx) > 0:
                 mean_channels = np.mean(eeg_data[good_eeg_idx], axis=0)
-                eeg_channels_idx = [ch.ch_number for ch in self.eeg_channels if not ch.reference]
-                for idx in eeg_channels_idx:
-                    eeg_data[idx] -= mean_channels
+                eeg_data[self._non_ref_idx] -= mean_channels
         elif reference == 'ref':
             # Use reference electrodes
-            ref_channels_idx = [ch.ch_number for ch in self.eeg_channels if ch.reference]
-            eeg_channels_idx = [ch.ch_number for ch in self.eeg_channels if not ch.reference]
-            if len(ref_channels_idx) > 0 and len(eeg_channels_idx) > 0:
-                mean_reference = np.mean(eeg_data[ref_channels_idx], axis=0)
-                for idx in eeg_channels_idx:
-                    eeg_data[idx] -= mean_reference
+            if len(self._ref_idx) > 0 and len(self._non_ref_idx) > 0:
+                mean_reference = np.mean(eeg_data[self._ref_idx], axis=0)
+                eeg_data[self._non_ref_idx] -= mean_reference
 
         return eeg_data
 
     def _process_eeg(self, eeg_data, bad_channels):
-        """Process EEG data to extract band powers and brain metrics (match original)."""
-        avg_bands = [0, 0, 0, 0, 0]
-        inverse_workload_idx = 0
-        engagement_idx = 0
-
-        valid_channel_count = 0
-
-        for eeg_channel in self.eeg_channels:
-            if eeg_channel.reference or eeg_channel in bad_channels:
-                continue
-
-            if eeg_channel.ch_number >= eeg_data.shape[0]:
-                continue
-
-            # Take the power metric window (last N samples)
-            channel_data = eeg_data[eeg_channel.ch_number][-int(self.power_metric_window_s * self.eeg_sr):].copy()
-
-            if len(channel_data) < 100:
-                continue
+        """
+        Process EEG data to extract band powers and brain metrics (match original).
+
+        eeg_data is the already filtered window from _update_filtered_ring; all good
+        channels are Welch'd as one (channels, samples) block.
+        """
+        channel_idx = self._good_channel_idx(bad_channels)
+        channel_idx = channel_idx[channel_idx < eeg_data.shape[0]]
+
+        # Take the power metric window (last N samples)
+        window_data = eeg_data[:, -self._eeg_win:]
+        n_samples = window_data.shape[1]
+
+        if len(channel_idx) == 0 or n_samples < 100:
+            return [0, 0, 0, 0, 0], 0, 0
+
+        # Gather the good rows straight into the preallocated float32 buffer in one call
+        # (no float64 fancy-index temporary, no per-row Python loop)
+        block = self._eeg_block[:len(channel_idx), :n_samples]
+        np.take(window_data, channel_idx, axis=0, out=block)
+
+        # No separate detrend pass: the ring is already bandpassed (zero gain at DC) and
+        # welch removes each segment's mean (detrend='constant')
+        # Compute PSD with a pinned segment length so the FFT size (and pocketfft's
+        # cached plan) stays the same every tick; only the warm-up window is shorter
+        if block.shape[1] < self.psd_size:
+            nperseg = block.shape[1]
+            window = 'hann'
+        else:
+            nperseg = self.psd_size
+            window = self._psd_window
 
-            # Detrend
-            channel_data = channel_data - np.mean(channel_data)
+        freq, psd = welch(block, fs=self.eeg_sr, window=window, nperseg=nperseg, axis=1)
 
-            # Bandpass filter
-            b_bp, a_bp = butter(2, [1.0/(self.eeg_sr/2), min(59.0/(self.eeg_sr/2), 0.99)], btype='band')
-            channel_data = filtfilt(b_bp, a_bp, channel_data)
+        # Compute band powers per channel with one matrix product, shape (5, channels)
+        # (use sum to match BrainFlow's get_band_power)
+        bands = self._get_band_matrix(self.eeg_sr, nperseg) @ psd.T
+        delta, theta, alpha, beta, gamma = bands
 
-            # Bandstop (notch) filter
-            if 48.0/(self.eeg_sr/2) < 0.99 and 52.0/(self.eeg_sr/2) < 0.99:
-                b_notch, a_notch = butter(2, [48.0/(self.eeg_sr/2), 52.0/(self.eeg_sr/2)], btype='bandstop')
-                channel_data = filtfilt(b_notch, a_notch, channel_data)
+        # Average the bands across channels
+        avg_bands = bands.mean(axis=1).tolist()
 
-            # Compute PSD
-            if len(channel_data) < self.psd_size:
-                nperseg = min(len(channel_data), 256)
-            else:
-                nperseg = self.psd_size
-
-            freq, psd = welch(channel_data, fs=self.eeg_sr, nperseg=nperseg)
-
-            # Compute band powers (use sum to match BrainFlow's get_band_power)
-            def band_power(low, high):
-                idx = np.logical_and(freq >= low, freq <= high)
-                return np.sum(psd[idx]) if np.any(idx) else 0.0
-
-            delta = band_power(1.0, 4.0)
-            theta = band_power(4.0, 8.0)
-            alpha = band_power(8.0, 13.0)
-            beta = band_power(13.0, 30.0)
-            gamma = band_power(30.0, 60.0)
-
-            avg_bands[0] += delta
-            avg_bands[1] += theta
-            avg_bands[2] += alpha
-            avg_bands[3] += beta
-            avg_bands[4] += gamma
-
-            # Compute brain metrics (match original formulas)
-            if (theta + alpha) > 0 and gamma > 0:
-                engagement_idx += (beta / (theta + alpha)) / gamma
-                inverse_workload_idx += (alpha / theta) / gamma if theta > 0 else 0
-
-            valid_channel_count += 1
-
-        # Average the bands and metrics
-        if valid_channel_count > 0:
-            avg_bands = [x / valid_channel_count for x in avg_bands]
-            engagement_idx = engagement_idx / valid_channel_count
-            inverse_workload_idx = inverse_workload_idx / valid_channel_count
-        else:
-            avg_bands = [0, 0, 0, 0, 0]
-            engagement_idx = 0
-            inverse_workload_idx = 0
+        engagement_idx, inverse_workload_idx = _brain_metrics(theta, alpha, beta, gamma)
 
         return avg_bands, engagement_idx, inverse_workload_idx
 
-    def _compute_weighted_mean(self, hist):
-        """Compute weighted mean with weights increasing linearly."""
-        weighted_sum = 0
-        sumweight = 0
-        for count, hist_val in enumerate(hist):
-            weighted_sum += hist_val * count
-            sumweight += count
-        return weighted_sum / sumweight if sumweight > 0 else 0
+    def _good_channel_idx(self, bad_channels):
+        """
+        Row indices of the non-reference EEG channels not in bad_channels.
+
+        Re-referencing, processing and the good-channel count all ask for the same
+        tick's bad channels, so the result is memoised on the (immutable) tuple
+        returned by _detect_bad_channels and membership is a set lookup.
+        """
+        if not bad_channels:
+            return self._non_ref_idx
+        memo_key, good_idx = self._good_idx_memo
+        if memo_key is not bad_channels:
+            bad = {ch.ch_number for ch in bad_channels}
+            good_idx = self._non_ref_idx[[idx not in bad for idx in self._non_ref_idx.tolist()]]
+            self._good_idx_memo = (bad_channels, good_idx)
+        return good_idx
+
+    def _update_filtered_ring(self, eeg_data):
+        """
+        Filter the samples that arrived since the last tick and slide them into the EEG ring.
+
+        The bandpass and notch filters run causally (sosfilt) with their state kept between
+        ticks, so each sample is filtered exactly once instead of re-running sosfiltfilt
+        over the whole window every tick.
+
+        Args:
+            eeg_data: Latest BrainFlow window (all rows of the EEG preset)
+
+        Returns:
+            Filtered window (rows indexed by ch_number, non-EEG rows zero); a scratch copy
+            that may be modified in place
+        """
+        timestamps = eeg_data[self._ts_channel]
+        start = 0
+        if self._last_ts is not None:
+            start = int(np.searchsorted(timestamps, self._last_ts, side='right'))
+
+        new_data = eeg_data[self._eeg_rows, start:]
+        n_new = new_data.shape[1]
+        if n_new > 0:
+            if self._ring_zi is None or start == 0:
+                # First tick, or a gap longer than the window: restart the filters here
+                self._ring_zi = sosfilt_zi(self._ring_sos)[:, None, :] * new_data[:, :1]
+                self._ring_fill = 0
+            filtered, self._ring_zi = sosfilt(self._ring_sos, new_data, axis=1, zi=self._ring_zi)
+
+            ring = self._eeg_ring
+            size = ring.shape[1]
+            if n_new >= size:
+                ring[self._eeg_rows] = filtered[:, -size:]
+            else:
+                ring[:, :-n_new] = ring[:, n_new:]
+                ring[self._eeg_rows, -n_new:] = filtered
+            self._ring_fill = min(self._ring_fill + n_new, size)
+            self._last_ts = timestamps[-1]
+
+        size = self._eeg_ring.shape[1]
+        out = self._ring_out[:, size - self._ring_fill:]
+        np.copyto(out, self._eeg_ring[:, size - self._ring_fill:])
+        return out
+
+    def _get_filters(self, sr, bp_low=1.0, bp_high=59.0, notch_low=48.0, notch_high=52.0):
+        """
+        Get bandpass and notch filter coefficients, designing them only once.
+
+        Returns:
+            Tuple (sos_bp, sos_notch) of second-order sections; sos_notch is None
+            when the notch band is too close to Nyquist for this sample rate.
+        """
+        key = (sr, bp_low, bp_high, notch_low, notch_high)
+        filters = self._filter_cache.get(key)
+        if filters is None:
+            nyq = sr / 2
+            sos_bp = butter(2, [bp_low / nyq, min(bp_high / nyq, 0.99)], btype='band', output='sos')
+            if notch_low / nyq < 0.99 and notch_high / nyq < 0.99:
+                sos_notch = butter(2, [notch_low / nyq, notch_high / nyq], btype='bandstop', output='sos')
+            else:
+                sos_notch = None
+            filters = (sos_bp, sos_notch)
+            self._filter_cache[key] = filters
+        return filters
+
+    def _design_first_order(self, cutoff, btype):
+        """First-order Butterworth as second-order sections, or None if cutoff >= Nyquist."""
+        normal_cutoff = cutoff / (0.5 * self.eeg_sr)
+        if normal_cutoff >= 1.0:
+            return None
+        return butter(1, normal_cutoff, btype=btype, output='sos')
+
+    def _get_line_slice(self, sr, nperseg):
+        """Get the contiguous Welch bin range strictly between 45 and 55 Hz, once per (sr, nperseg)."""
+        key = (sr, nperseg)
+        line_slice = self._line_slice_cache.get(key)
+        if line_slice is None:
+            freq = np.fft.rfftfreq(nperseg, 1.0 / sr)  # Same bins as welch(nperseg=nperseg)
+            line_slice = slice(
+                int(np.searchsorted(freq, 45, side='right')),
+                int(np.searchsorted(freq, 55, side='left'))
+            )
+            self._line_slice_cache[key] = line_slice
+        return line_slice
+
+    def _get_band_matrix(self, sr, nperseg):
+        """
+        Get the EEG band membership matrix for the Welch bins, computed once per (sr, nperseg).
+
+        Returns:
+            (5, n_freqs) array with 1 where a frequency bin belongs to the band
+            (rows: delta, theta, alpha, beta, gamma)
+        """
+        key = (sr, nperseg)
+        band_matrix = self._band_matrix_cache.get(key)
+        if band_matrix is None:
+            freq = np.fft.rfftfreq(nperseg, 1.0 / sr)  # Same bins as welch(nperseg=nperseg)
+            band_matrix = np.array([
+                (freq >= low) & (freq <= high)
+                for low, high in ((1.0, 4.0), (4.0, 8.0), (8.0, 13.0), (13.0, 30.0), (30.0, 60.0))
+            ], dtype=np.float64)
+            self._band_matrix_cache[key] = band_matrix
+        return band_matrix
 
     def stop(self):
         """Stop the worker thread."""
         self._running = False
+        self._wake.set()
         self.quit()
         self.wait()
@@ -5,9 +5,10 @@ This module provides concrete implementations for filtering, spectral analysis,
 and preprocessing of EEG/biosignal data using BrainFlow and SciPy.
 """
 
+from functools import lru_cache
 from typing import Tuple, Optional
 import numpy as np
-from scipy.signal import butter, filtfilt, welch
+from scipy.signal import butter, filtfilt, sosfilt, welch
 from brainflow import DataFilter, DetrendOperations, FilterTypes, WindowOperations
 
 from src.domain.interfaces.i_analysis_service import ISignalProcessor
@@ -21,6 +22,80 @@ from src.common.utils.logger import get_logger
 logger = get_logger(__name__)
 
 
+# Window name -> BrainFlow window enum value for compute_psd
+_PSD_WINDOWS = {
+    'blackman_harris': WindowOperations.BLACKMAN_HARRIS.value,
+    'hamming': WindowOperations.HAMMING.value,
+    'hanning': WindowOperations.HANNING.value,
+}
+
+
+# Positions of the bands in the array returned by compute_eeg_bands
+BAND_DELTA = 0
+BAND_THETA = 1
+BAND_ALPHA = 2
+BAND_BETA = 3
+BAND_GAMMA = 4
+_BAND_KEYS = ('delta', 'theta', 'alpha', 'beta', 'gamma')
+
+# Standard EEG bands as a (5, 2) array of (low, high) in Hz, in compute_eeg_bands order
+_EEG_BAND_RANGES = np.array([
+    EEGBands.DELTA, EEGBands.THETA, EEGBands.ALPHA, EEGBands.BETA, EEGBands.GAMMA
+], dtype=np.float64)
+
+
+def _band_powers(frequencies: np.ndarray, power_values: np.ndarray, band_ranges: np.ndarray) -> np.ndarray:
+    """
+    Trapezoidal power in each (low, high) band over the PSD bins inside it.
+
+    The trapezoids between neighbouring bins are summed cumulatively once, so every
+    band is a difference of two prefix sums; the bin bounds of all bands come from
+    one searchsorted call each.
+    """
+    frequencies = np.asarray(frequencies, dtype=np.float64)
+    power_values = np.asarray(power_values, dtype=np.float64)
+    segments = 0.5 * np.diff(frequencies) * (power_values[1:] + power_values[:-1])
+    cumulative = np.concatenate(([0.0], np.cumsum(segments)))
+
+    # First bin >= low and last bin <= high; bands with fewer than two bins give 0
+    lo = np.minimum(np.searchsorted(frequencies, band_ranges[:, 0], side='left'), len(cumulative) - 1)
+    hi = np.maximum(np.searchsorted(frequencies, band_ranges[:, 1], side='right') - 1, lo)
+    return cumulative[hi] - cumulative[lo]
+
+
+def _band_bin_counts(frequencies: np.ndarray, band_ranges: np.ndarray) -> np.ndarray:
+    """Number of PSD bins inside each (low, high) band."""
+    return (np.searchsorted(frequencies, band_ranges[:, 1], side='right')
+            - np.searchsorted(frequencies, band_ranges[:, 0], side='left'))
+
+
+@lru_cache(maxsize=16)
+def _default_psd_size(sampling_rate: int) -> int:
+    """Nearest power of two to the sampling rate, looked up once per rate."""
+    return DataFilter.get_nearest_power_of_two(sampling_rate)
+
+
+@lru_cache(maxsize=32)
+def _bandpass_sos(order: int, low_freq: float, high_freq: float, sampling_rate: float) -> np.ndarray:
+    """Butterworth bandpass as second-order sections, designed once per parameter set."""
+    return butter(order, [low_freq, high_freq], btype='band', output='sos', fs=sampling_rate)
+
+
+def _target_buffer(data: np.ndarray, out: Optional[np.ndarray], inplace: bool) -> np.ndarray:
+    """
+    Pick the array a BrainFlow in-place operation should modify.
+
+    data itself when inplace, otherwise out (filled with one np.copyto) when given,
+    otherwise a fresh copy so the caller's data is left untouched.
+    """
+    if inplace:
+        return data
+    if out is not None:
+        np.copyto(out, data, casting='no')
+        return out
+    return data.copy()
+
+
 class BrainFlowSignalProcessor(ISignalProcessor):
     """
     Signal processor implementation using BrainFlow and SciPy.
@@ -34,6 +109,7 @@ class BrainFlowSignalProcessor(ISignalProcessor):
 
     def __init__(self):
         """Initialize the signal processor."""
+        self._band_grid = None  # (bins, first, last) of the last PSD grid checked for sparse bands
         logger.info("BrainFlowSignalProcessor initialized")
 
     def apply_bandpass_filter(
@@ -42,7 +118,9 @@ class BrainFlowSignalProcessor(ISignalProcessor):
         sampling_rate: float,
         low_freq: float,
         high_freq: float,
-        order: int = 2
+        order: int = 2,
+        out: Optional[np.ndarray] = None,
+        inplace: bool = False
     ) -> np.ndarray:
         """
         Apply bandpass filter to the signal using BrainFlow.
@@ -53,6 +131,8 @@ class BrainFlowSignalProcessor(ISignalProcessor):
             low_freq: Lower cutoff frequency in Hz
             high_freq: Upper cutoff frequency in Hz
             order: Filter order (default: 2)
+            out: Optional preallocated float64 buffer to filter into instead of a copy
+            inplace: Filter data itself (no copy); takes precedence over out
 
         Returns:
             Filtered signal data
@@ -62,22 +142,10 @@ class BrainFlowSignalProcessor(ISignalProcessor):
             SignalProcessingException: If filtering fails
         """
         try:
-            # Validate parameters
-            if low_freq <= 0 or high_freq <= 0:
-                raise InvalidFilterParametersError("Frequencies must be positive")
+            self._validate_bandpass(sampling_rate, low_freq, high_freq)
 
-            if low_freq >= high_freq:
-                raise InvalidFilterParametersError(
-                    f"Low frequency ({low_freq}) must be less than high frequency ({high_freq})"
-                )
-
-            if high_freq >= sampling_rate / 2:
-                raise InvalidFilterParametersError(
-                    f"High frequency ({high_freq}) must be less than Nyquist frequency ({sampling_rate/2})"
-                )
-
-            # Make a copy to avoid modifying original data
-            filtered_data = data.copy()
+            # Copy only when the caller's data must be left untouched
+            filtered_data = _target_buffer(data, out, inplace)
 
             # Apply bandpass filter using BrainFlow
             DataFilter.perform_bandpass(
@@ -100,13 +168,77 @@ class BrainFlowSignalProcessor(ISignalProcessor):
             logger.error(error_msg, exc_info=True)
             raise SignalProcessingException(error_msg)
 
+    def apply_bandpass_filter_batch(
+        self,
+        data: np.ndarray,
+        sampling_rate: float,
+        low_freq: float,
+        high_freq: float,
+        order: int = 2
+    ) -> np.ndarray:
+        """
+        Apply a bandpass filter to all channels at once.
+
+        Same causal Butterworth design as apply_bandpass_filter, run with SciPy as
+        second-order sections along the last axis: one C-level pass over the whole
+        (n_channels, n_samples) block instead of one copy and one BrainFlow call per
+        channel. The SOS coefficients are cached per parameter set.
+
+        Args:
+            data: Input signal data (n_channels, n_samples); 1D arrays are accepted too
+            sampling_rate: Sampling rate of the signal in Hz
+            low_freq: Lower cutoff frequency in Hz
+            high_freq: Upper cutoff frequency in Hz
+            order: Filter order (default: 2)
+
+        Returns:
+            Filtered signal data (new float64 array, same shape as data)
+
+        Raises:
+            InvalidFilterParametersError: If filter parameters are invalid
+            SignalProcessingException: If filtering fails
+        """
+        try:
+            self._validate_bandpass(sampling_rate, low_freq, high_freq)
+
+            sos = _bandpass_sos(order, float(low_freq), float(high_freq), float(sampling_rate))
+            filtered_data = sosfilt(sos, np.asarray(data, dtype=np.float64), axis=-1)
+
+            logger.debug(f"Applied batch bandpass filter: {low_freq}-{high_freq} Hz @ {sampling_rate} Hz, shape {filtered_data.shape}")
+            return filtered_data
+
+        except InvalidFilterParametersError:
+            raise
+        except Exception as e:
+            error_msg = f"Bandpass filtering failed: {str(e)}"
+            logger.error(error_msg, exc_info=True)
+            raise SignalProcessingException(error_msg)
+
+    @staticmethod
+    def _validate_bandpass(sampling_rate: float, low_freq: float, high_freq: float) -> None:
+        """Raise InvalidFilterParametersError unless 0 < low_freq < high_freq < Nyquist."""
+        if low_freq <= 0 or high_freq <= 0:
+            raise InvalidFilterParametersError("Frequencies must be positive")
+
+        if low_freq >= high_freq:
+            raise InvalidFilterParametersError(
+                f"Low frequency ({low_freq}) must be less than high frequency ({high_freq})"
+            )
+
+        if high_freq >= sampling_rate / 2:
+            raise InvalidFilterParametersError(
+                f"High frequency ({high_freq}) must be less than Nyquist frequency ({sampling_rate/2})"
+            )
+
     def apply_notch_filter(
         self,
         data: np.ndarray,
         sampling_rate: float,
         notch_freq: float,
         bandwidth: float = 4.0,
-        order: int = 2
+        order: int = 2,
+        out: Optional[np.ndarray] = None,
+        inplace: bool = False
     ) -> np.ndarray:
         """
         Apply notch filter to remove line noise using BrainFlow bandstop.
@@ -117,6 +249,8 @@ class BrainFlowSignalProcessor(ISignalProcessor):
             notch_freq: Frequency to notch out (e.g., 50Hz or 60Hz)
             bandwidth: Bandwidth of the notch in Hz (default: 4.0)
             order: Filter order (default: 2)
+            out: Optional preallocated float64 buffer to filter into instead of a copy
+            inplace: Filter data itself (no copy); takes precedence over out
 
         Returns:
             Filtered signal data
@@ -135,8 +269,8 @@ class BrainFlowSignalProcessor(ISignalProcessor):
                     f"Notch frequency ({notch_freq}) must be less than Nyquist frequency ({sampling_rate/2})"
                 )
 
-            # Make a copy to avoid modifying original data
-            filtered_data = data.copy()
+            # Copy only when the caller's data must be left untouched
+            filtered_data = _target_buffer(data, out, inplace)
 
             # Calculate bandstop range
             low_freq = max(0.1, notch_freq - bandwidth / 2)
@@ -188,7 +322,7 @@ class BrainFlowSignalProcessor(ISignalProcessor):
         try:
             # Determine FFT size
             if nperseg is None:
-                psd_size = DataFilter.get_nearest_power_of_two(int(sampling_rate))
+                psd_size = _default_psd_size(int(sampling_rate))
             else:
                 psd_size = nperseg
 
@@ -199,12 +333,7 @@ class BrainFlowSignalProcessor(ISignalProcessor):
                 )
 
             # Get window operation enum
-            window_map = {
-                'blackman_harris': WindowOperations.BLACKMAN_HARRIS.value,
-                'hamming': WindowOperations.HAMMING.value,
-                'hanning': WindowOperations.HANNING.value,
-            }
-            window_type = window_map.get(window, WindowOperations.BLACKMAN_HARRIS.value)
+            window_type = _PSD_WINDOWS.get(window, WindowOperations.BLACKMAN_HARRIS.value)
 
             # Compute PSD using BrainFlow
             psd_data = DataFilter.get_psd_welch(
@@ -233,7 +362,7 @@ class BrainFlowSignalProcessor(ISignalProcessor):
         band_range: Tuple[float, float]
     ) -> float:
         """
-        Compute power in a specific frequency band using BrainFlow.
+        Compute power in a specific frequency band (trapezoidal rule over its PSD bins).
 
         Args:
             psd_data: Tuple of (frequencies, power_values) from compute_psd
@@ -243,6 +372,7 @@ class BrainFlowSignalProcessor(ISignalProcessor):
             Power in the specified frequency band
 
         Raises:
+            InvalidFilterParametersError: If the band is empty or covers fewer than two PSD bins
             SignalProcessingException: If band power computation fails
         """
         try:
@@ -255,15 +385,20 @@ class BrainFlowSignalProcessor(ISignalProcessor):
                     f"Low frequency ({low_freq}) must be less than high frequency ({high_freq})"
                 )
 
-            # Reconstruct PSD array for BrainFlow (2D array format)
-            psd_array = np.array([power_values, frequencies])
+            band = np.array([band_range], dtype=np.float64)
+            n_bins = int(_band_bin_counts(frequencies, band)[0])
+            if n_bins < 2:
+                raise InvalidFilterParametersError(
+                    f"Band {low_freq}-{high_freq} Hz covers {n_bins} PSD bin(s); at least 2 are needed"
+                )
 
-            # Compute band power using BrainFlow
-            band_power = DataFilter.get_band_power(psd_array, low_freq, high_freq)
+            band_power = float(_band_powers(frequencies, power_values, band)[0])
 
             logger.debug(f"Computed band power for {low_freq}-{high_freq} Hz: {band_power:.4f}")
             return band_power
 
+        except InvalidFilterParametersError:
+            raise
         except Exception as e:
             error_msg = f"Band power computation failed: {str(e)}"
             logger.error(error_msg, exc_info=True)
@@ -272,7 +407,7 @@ class BrainFlowSignalProcessor(ISignalProcessor):
     def compute_eeg_bands(
         self,
         psd_data: Tuple[np.ndarray, np.ndarray]
-    ) -> dict:
+    ) -> np.ndarray:
         """
         Compute power for all standard EEG bands.
 
@@ -280,18 +415,26 @@ class BrainFlowSignalProcessor(ISignalProcessor):
             psd_data: Tuple of (frequencies, power_values) from compute_psd
 
         Returns:
-            Dictionary with band names as keys and power values as values
+            float32 array of shape (5,) indexed by BAND_DELTA ... BAND_GAMMA
+            (use compute_eeg_bands_dict for a name -> power dictionary).
+            Bands covering fewer than two PSD bins are reported as 0; this is
+            logged once per frequency grid, not on every call.
         """
         try:
-            bands = {
-                'delta': self.compute_band_power(psd_data, EEGBands.DELTA),
-                'theta': self.compute_band_power(psd_data, EEGBands.THETA),
-                'alpha': self.compute_band_power(psd_data, EEGBands.ALPHA),
-                'beta': self.compute_band_power(psd_data, EEGBands.BETA),
-                'gamma': self.compute_band_power(psd_data, EEGBands.GAMMA),
-            }
-
-            logger.debug(f"Computed EEG bands: {bands}")
+            # All five bands in one vectorised pass over the PSD
+            frequencies, power_values = psd_data
+            frequencies = np.asarray(frequencies, dtype=np.float64)
+            grid = (frequencies.size, float(frequencies[0]), float(frequencies[-1])) if frequencies.size else (0,)
+            if grid != self._band_grid:
+                # Called per frame: only a new PSD grid is re-checked (and warned about)
+                self._band_grid = grid
+                sparse = np.flatnonzero(_band_bin_counts(frequencies, _EEG_BAND_RANGES) < 2)
+                if sparse.size:
+                    logger.warning("EEG band(s) %s cover fewer than 2 PSD bins; reporting 0 power",
+                                   ", ".join(_BAND_KEYS[i] for i in sparse))
+            bands = _band_powers(frequencies, power_values, _EEG_BAND_RANGES).astype(np.float32)
+
+            logger.debug("Computed EEG bands: %s", bands)
             return bands
 
         except Exception as e:
@@ -299,13 +442,36 @@ class BrainFlowSignalProcessor(ISignalProcessor):
             logger.error(error_msg, exc_info=True)
             raise SignalProcessingException(error_msg)
 
-    def detrend(self, data: np.ndarray, method: str = 'constant') -> np.ndarray:
+    def compute_eeg_bands_dict(
+        self,
+        psd_data: Tuple[np.ndarray, np.ndarray]
+    ) -> dict:
+        """
+        Compute power for all standard EEG bands as a dictionary (for UI code).
+
+        Args:
+            psd_data: Tuple of (frequencies, power_values) from compute_psd
+
+        Returns:
+            Dictionary with band names ('delta' ... 'gamma') as keys and power values as values
+        """
+        return dict(zip(_BAND_KEYS, self.compute_eeg_bands(psd_data).tolist()))
+
+    def detrend(
+        self,
+        data: np.ndarray,
+        method: str = 'constant',
+        out: Optional[np.ndarray] = None,
+        inplace: bool = False
+    ) -> np.ndarray:
         """
         Remove linear trend from the signal using BrainFlow.
 
         Args:
             data: Input signal data (1D array)
             method: Detrending method ('constant' or 'linear')
+            out: Optional preallocated float64 buffer to detrend into instead of a copy
+            inplace: Detrend data itself (no copy); takes precedence over out
 
         Returns:
             Detrended signal data
@@ -314,9 +480,6 @@ class BrainFlowSignalProcessor(ISignalProcessor):
             SignalProcessingException: If detrending fails
         """
         try:
-            # Make a copy to avoid modifying original data
-            detrended_data = data.copy()
-
             # Get detrend operation
             if method == 'constant':
                 operation = DetrendOperations.CONSTANT.value
@@ -325,6 +488,9 @@ class BrainFlowSignalProcessor(ISignalProcessor):
             else:
                 raise InvalidFilterParametersError(f"Unknown detrend method: {method}")
 
+            # Copy only when the caller's data must be left untouched
+            detrended_data = _target_buffer(data, out, inplace)
+
             # Apply detrending using BrainFlow
             DataFilter.detrend(detrended_data, operation)
 
@@ -362,28 +528,31 @@ class BrainFlowSignalProcessor(ISignalProcessor):
             Preprocessed signal data
         """
         try:
+            # One copy up front; every stage then works in place on it
             processed_data = data.copy()
 
             # 1. Detrend
             if apply_detrend:
-                processed_data = self.detrend(processed_data, method='constant')
+                self.detrend(processed_data, method='constant', inplace=True)
 
             # 2. Bandpass filter (1-59 Hz for EEG)
             if apply_bandpass:
-                processed_data = self.apply_bandpass_filter(
+                self.apply_bandpass_filter(
                     processed_data,
                     sampling_rate,
                     low_freq=SignalProcessing.BANDPASS_LOW,
-                    high_freq=SignalProcessing.BANDPASS_HIGH
+                    high_freq=SignalProcessing.BANDPASS_HIGH,
+                    inplace=True
                 )
 
             # 3. Notch filter (remove line noise)
             if apply_notch:
-                processed_data = self.apply_notch_filter(
+                self.apply_notch_filter(
                     processed_data,
                     sampling_rate,
                     notch_freq=notch_freq,
-                    bandwidth=4.0
+                    bandwidth=4.0,
+                    inplace=True
                 )
 
             logger.debug("Applied EEG preprocessing pipeline")
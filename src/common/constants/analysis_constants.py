@@ -24,6 +24,9 @@ class BrainPowerDefaults:
     # Reference method
     REFERENCE = "mean"          # "mean" or "median"
 
+    # Bad-channel filters: zero-phase (forward-backward) or a single causal pass
+    ZERO_PHASE = True
+
     # Metric names
     METRIC_NAMES = ["Short-term", "Long-term", "Final"]
 
@@ -63,6 +66,7 @@ class AnalysisDefaults:
         "power_length": BrainPowerDefaults.POWER_LENGTH,
         "scale": BrainPowerDefaults.SCALE,
         "reference": BrainPowerDefaults.REFERENCE,
+        "zero_phase": BrainPowerDefaults.ZERO_PHASE,
     }
 
 
@@ -7,6 +7,7 @@ and handling platform-specific operations.
 
 import sys
 import platform
+import functools
 from pathlib import Path
 from typing import Tuple, Optional
 import subprocess
@@ -36,6 +37,7 @@ class PlatformInfo:
         return sys.platform.startswith('linux')
 
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def get_platform_name() -> str:
         """
         Get human-readable platform name.
@@ -53,6 +55,7 @@ class PlatformInfo:
             return "Unknown"
 
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def get_platform_details() -> str:
         """
         Get detailed platform information.
@@ -68,6 +71,7 @@ class PlatformInfo:
         return sys.version
 
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def get_architecture() -> str:
         """Get system architecture (e.g., 'x86_64', 'arm64')."""
         return platform.machine()
@@ -81,11 +85,23 @@ class BluetoothHelper:
     on different platforms.
     """
 
+    # Set (to any non-empty value) to skip Bluetooth probing entirely
+    SKIP_CHECK_ENV_VAR = 'IXR_SKIP_BT_CHECK'
+
+    @staticmethod
+    def is_check_skipped() -> bool:
+        """Check if Bluetooth probing has been disabled via the environment."""
+        return bool(os.environ.get(BluetoothHelper.SKIP_CHECK_ENV_VAR))
+
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def check_bluetooth_available() -> Tuple[bool, Optional[str]]:
         """
         Check if Bluetooth is available on the system.
 
+        The result is cached because the probe may spawn a subprocess;
+        call invalidate() to force a fresh check.
+
         Returns:
             Tuple[bool, Optional[str]]: (is_available, error_message)
         """
@@ -98,6 +114,11 @@ class BluetoothHelper:
         else:
             return False, "Unsupported platform"
 
+    @staticmethod
+    def invalidate() -> None:
+        """Clear the cached Bluetooth availability result."""
+        BluetoothHelper.check_bluetooth_available.cache_clear()
+
     @staticmethod
     def _check_windows_bluetooth() -> Tuple[bool, Optional[str]]:
         """Check Bluetooth on Windows."""
@@ -267,7 +288,10 @@ def get_diagnostic_info() -> dict:
     Returns:
         dict: Dictionary containing diagnostic information
     """
-    bluetooth_available, bluetooth_error = BluetoothHelper.check_bluetooth_available()
+    if BluetoothHelper.is_check_skipped():
+        bluetooth_available, bluetooth_error = None, None
+    else:
+        bluetooth_available, bluetooth_error = BluetoothHelper.check_bluetooth_available()
 
     return {
         'platform': PlatformInfo.get_platform_name(),
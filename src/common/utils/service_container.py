@@ -6,7 +6,7 @@ dependencies and promoting loose coupling.
 """
 
 from typing import Any, Callable, Dict, Optional, Type, TypeVar
-from threading import Lock
+from threading import Lock, RLock
 import logging
 
 logger = logging.getLogger(__name__)
@@ -20,6 +20,7 @@ class ServiceContainer:
 
     Supports:
     - Singleton registration (single instance reused)
+    - Lazy singleton registration (factory run once, on first resolution)
     - Transient registration (new instance each time)
     - Factory registration (custom creation logic)
     - Interface to implementation mapping
@@ -30,7 +31,9 @@ class ServiceContainer:
         self._singletons: Dict[Type, Any] = {}
         self._transients: Dict[Type, Callable] = {}
         self._factories: Dict[Type, Callable] = {}
-        self._lock = Lock()
+        self._singleton_factories: Dict[Type, Callable] = {}
+        # Re-entrant so a lazy singleton's factory can resolve its own dependencies
+        self._lock = RLock()
 
     def register_singleton(self, service_type: Type[T], instance: T) -> None:
         """
@@ -46,6 +49,23 @@ class ServiceContainer:
             self._singletons[service_type] = instance
             logger.debug(f"Registered singleton: {service_type.__name__}")
 
+    def register_singleton_factory(self, service_type: Type[T],
+                                   factory: Callable[[], T]) -> None:
+        """
+        Register a lazily created singleton.
+
+        The factory is called on the first resolution and its result is
+        returned for all later resolutions.
+
+        Args:
+            service_type: The type/interface to register
+            factory: Function that creates and returns the instance
+        """
+        with self._lock:
+            self._singletons.pop(service_type, None)
+            self._singleton_factories[service_type] = factory
+            logger.debug(f"Registered lazy singleton: {service_type.__name__}")
+
     def register_transient(self, service_type: Type[T],
                           implementation: Type[T]) -> None:
         """
@@ -93,6 +113,13 @@ class ServiceContainer:
             if service_type in self._singletons:
                 return self._singletons[service_type]
 
+            # Build lazy singletons on first use
+            if service_type in self._singleton_factories:
+                instance = self._singleton_factories.pop(service_type)()
+                self._singletons[service_type] = instance
+                logger.debug(f"Created lazy singleton: {service_type.__name__}")
+                return instance
+
             # Check factories
             if service_type in self._factories:
                 factory = self._factories[service_type]
@@ -136,6 +163,7 @@ class ServiceContainer:
         """
         with self._lock:
             return (service_type in self._singletons or
+                   service_type in self._singleton_factories or
                    service_type in self._transients or
                    service_type in self._factories)
 
@@ -148,6 +176,7 @@ class ServiceContainer:
         """
         with self._lock:
             self._singletons.pop(service_type, None)
+            self._singleton_factories.pop(service_type, None)
             self._transients.pop(service_type, None)
             self._factories.pop(service_type, None)
             logger.debug(f"Unregistered service: {service_type.__name__}")
@@ -156,6 +185,7 @@ class ServiceContainer:
         """Clear all registered services."""
         with self._lock:
             self._singletons.clear()
+            self._singleton_factories.clear()
             self._transients.clear()
             self._factories.clear()
             logger.debug("Cleared all registered services")
@@ -163,6 +193,7 @@ class ServiceContainer:
 
 # Global service container instance
 _container = None
+_container_lock = Lock()
 
 
 def get_container() -> ServiceContainer:
@@ -174,7 +205,9 @@ def get_container() -> ServiceContainer:
     """
     global _container
     if _container is None:
-        _container = ServiceContainer()
+        with _container_lock:
+            if _container is None:
+                _container = ServiceContainer()
     return _container
 
 
@@ -192,6 +225,11 @@ def register_singleton(service_type: Type[T], instance: T) -> None:
     get_container().register_singleton(service_type, instance)
 
 
+def register_singleton_factory(service_type: Type[T], factory: Callable[[], T]) -> None:
+    """Register a lazily created singleton in the global container."""
+    get_container().register_singleton_factory(service_type, factory)
+
+
 def register_transient(service_type: Type[T], implementation: Type[T]) -> None:
     """Register a transient in the global container."""
     get_container().register_transient(service_type, implementation)
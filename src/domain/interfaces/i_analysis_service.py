@@ -6,7 +6,7 @@ analysis implementations.
 """
 
 from abc import ABC, ABCMeta, abstractmethod
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, List, Mapping, Tuple, Optional
 import numpy as np
 from PyQt5.QtCore import QObject
 
@@ -59,12 +59,12 @@ class IAnalysisService(QObject, metaclass=QABCMeta):
         pass
 
     @abstractmethod
-    def get_settings(self) -> Dict:
+    def get_settings(self) -> Mapping:
         """
         Get the current analysis settings.
 
         Returns:
-            Dict: Current analysis configuration
+            Mapping: Current analysis configuration (read-only)
         """
         pass
 
@@ -155,6 +155,25 @@ class ISignalProcessor(ABC):
 
         Returns:
             Power in the specified frequency band
+
+        Raises:
+            InvalidFilterParametersError: If the band covers fewer than two PSD bins
+        """
+        pass
+
+    @abstractmethod
+    def compute_eeg_bands(self, psd_data: Tuple[np.ndarray, np.ndarray]) -> np.ndarray:
+        """
+        Compute power in all standard EEG bands (delta, theta, alpha, beta, gamma).
+
+        Unlike compute_band_power, this does not raise for a band that covers
+        fewer than two PSD bins (too coarse a PSD): that band's power is 0.
+
+        Args:
+            psd_data: Tuple of (frequencies, power_values) from compute_psd
+
+        Returns:
+            float32 array of shape (5,), one power per band in the order above
         """
         pass
 
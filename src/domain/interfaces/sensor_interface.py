@@ -5,14 +5,32 @@ This interface defines the contract for all sensor implementations,
 providing methods for connection, streaming, and status monitoring.
 """
 
-from PyQt5.QtCore import QObject, pyqtSignal
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+import random
 import threading
 import time
+import weakref
 
 from src.common.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+STATUS_TICK_MS = 1000  # Period of the shared status monitor timer
+
+
+def release_sensor(sensor: "SensorInterface") -> None:
+    """
+    Disconnect a sensor if it is still connected.
+
+    Used as the weakref.finalize callback of the sensor adapters, so it must not
+    reference the adapter itself.
+    """
+    try:
+        if sensor.connected:
+            sensor.disconnect()
+    except Exception as e:
+        logger.error(f"Error releasing sensor: {e}")
+
 
 class SensorInterface(QObject):
     """
@@ -20,20 +38,36 @@ class SensorInterface(QObject):
 
     Signals:
         status_changed: Emitted when sensor status changes (e.g., "Connected", "Disconnected", etc.)
+
+    Status checks for every sensor run from one QTimer on the GUI thread (see
+    start_status_check); only the auto-reconnect work is handed to a thread.
     """
     # Signal emitted when sensor status changes
     status_changed = pyqtSignal(str)
 
+    status_interval = 1.0  # seconds between status checks
+
+    # Shared status monitor: sensors with status checking started, polled by one timer
+    _monitored = weakref.WeakSet()
+    _monitor_lock = threading.Lock()
+    _monitor_timer = None
+
     def __init__(self):
         super(SensorInterface, self).__init__()
         self.connected = False
         self._status_running = False
-        self._status_thread = None
+        self._next_status_check = 0.0
+        self._reconnecting = False
         self._last_status = None
         # Auto-reconnect settings
         self.auto_reconnect_enabled = True
-        self.reconnect_interval = 2  # seconds between reconnect attempts
-        self._last_reconnect_attempt = 0
+        self.reconnect_interval = 2  # base delay in seconds between reconnect attempts
+        self.reconnect_backoff_cap = 30.0  # longest delay between reconnect attempts
+        self._reconnect_failures = 0
+        self._next_reconnect_attempt = 0.0
+        self._rng = random.Random()  # Per-sensor jitter source, independent of the global RNG
+        # Sensors are created on the GUI thread, so the shared timer is too
+        SensorInterface._ensure_status_monitor()
 
     def connect(self):
         """Establish connection to the sensor.
@@ -71,39 +105,82 @@ class SensorInterface(QObject):
         """
         return "Connected" if self.connected else "Disconnected"
 
-    def _status_worker(self):
+    def _check_status(self):
         """
-        Background thread that checks the sensor's status periodically.
+        Check the sensor's status once (runs on the GUI thread).
         If the status changes, it emits the status_changed signal.
         Also, if auto-reconnect is enabled and the sensor is disconnected,
-        it attempts to reconnect after a defined interval.
+        it starts a reconnect after a defined interval.
+        """
+        current_status = self.get_status()
+        if current_status != self._last_status:
+            self._last_status = current_status
+            self.status_changed.emit(current_status)
+        if not current_status.startswith("Not Alive"):
+            self._reconnect_failures = 0
+        # If auto-reconnect is enabled and sensor is disconnected,
+        # attempt to reconnect once the backoff delay has passed.
+        elif self.auto_reconnect_enabled and not self._reconnecting:
+            if time.time() >= self._next_reconnect_attempt:
+                self._reconnecting = True
+                threading.Thread(target=self._run_auto_reconnect, daemon=True).start()
+
+    def _run_auto_reconnect(self):
+        """Thread target wrapping _auto_reconnect so only one runs at a time."""
+        try:
+            self._auto_reconnect()
+        except Exception as e:
+            logger.error(f"Auto-reconnect failed: {e}")
+        finally:
+            # Exponential backoff with full jitter, so sensors (or app instances) that
+            # lost the same adapter do not keep retrying in lockstep
+            backoff = min(self.reconnect_backoff_cap,
+                          self.reconnect_interval * 2 ** min(self._reconnect_failures, 5))
+            self._reconnect_failures += 1
+            self._next_reconnect_attempt = time.time() + self._rng.uniform(0, backoff)
+            self._reconnecting = False
+
+    def _auto_reconnect(self):
+        """
+        Reconnect a sensor that was lost. Runs on a worker thread, so it may block.
+        Subclasses override this to add sensor-specific cleanup.
         """
-        while self._status_running:
-            current_status = self.get_status()
-            if current_status != self._last_status:
-                self._last_status = current_status
-                self.status_changed.emit(current_status)
-            # If auto-reconnect is enabled and sensor is disconnected,
-            # attempt to reconnect at defined intervals.
-            if self.auto_reconnect_enabled and current_status == "Not Alive":
-                now = time.time()
-                if now - self._last_reconnect_attempt >= self.reconnect_interval:
-                    self._last_reconnect_attempt = now
-                    logger.info("Auto-reconnect: attempting to reconnect sensor")
-                    self.connect()  # Expected to be non-blocking (or spawn its own thread)
-            time.sleep(1)
+        logger.info("Auto-reconnect: attempting to reconnect sensor")
+        self.connect()
+
+    @staticmethod
+    def _ensure_status_monitor():
+        """Create the shared status monitor timer on first use."""
+        if SensorInterface._monitor_timer is None:
+            timer = QTimer()
+            timer.setInterval(STATUS_TICK_MS)
+            timer.timeout.connect(SensorInterface._monitor_tick)
+            timer.start()
+            SensorInterface._monitor_timer = timer
+
+    @staticmethod
+    def _monitor_tick():
+        """Run the status check of every monitored sensor that is due."""
+        with SensorInterface._monitor_lock:
+            sensors = list(SensorInterface._monitored)
+        now = time.monotonic()
+        for sensor in sensors:
+            if sensor._status_running and now >= sensor._next_status_check:
+                sensor._next_status_check = now + sensor.status_interval
+                sensor._check_status()
 
     def start_status_check(self):
-        """Starts the background thread for status monitoring."""
+        """Registers the sensor with the shared status monitor."""
         if not self._status_running:
+            self._next_status_check = 0.0
             self._status_running = True
-            self._status_thread = threading.Thread(target=self._status_worker, daemon=True)
-            self._status_thread.start()
+            with SensorInterface._monitor_lock:
+                SensorInterface._monitored.add(self)
             logger.debug("Status checking started")
 
     def stop_status_check(self):
-        """Stops the background status-checking thread."""
+        """Removes the sensor from the shared status monitor."""
         self._status_running = False
-        if self._status_thread:
-            self._status_thread.join(timeout=2)
-            logger.debug("Status checking stopped")
+        with SensorInterface._monitor_lock:
+            SensorInterface._monitored.discard(self)
+        logger.debug("Status checking stopped")
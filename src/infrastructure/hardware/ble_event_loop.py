@@ -7,6 +7,7 @@ Cross-platform compatible (Windows, macOS, Linux).
 """
 
 import asyncio
+import functools
 import threading
 import sys
 
@@ -28,6 +29,7 @@ class BleEventLoop:
     """
 
     _instance = None
+    _instance_lock = threading.Lock()
 
     def __init__(self):
         # Platform-specific event loop creation
@@ -40,7 +42,14 @@ class BleEventLoop:
             logger.debug(f"Creating default event loop for {sys.platform}")
             self.loop = asyncio.new_event_loop()
 
-        self.thread = threading.Thread(target=self._thread_loop_runner, daemon=True)
+        # BLE notification callbacks are tiny; anything slower than this is a stall
+        # worth reporting when asyncio debug mode is enabled
+        self.loop.slow_callback_duration = 1.0
+
+        # Bind the loop once so scheduling a coroutine is a single call
+        self._submit = functools.partial(asyncio.run_coroutine_threadsafe, loop=self.loop)
+
+        self.thread = threading.Thread(target=self._thread_loop_runner, name="BleEventLoop", daemon=True)
         self.thread.start()
         logger.info(f"BLE event loop initialized for {sys.platform}")
 
@@ -48,7 +57,10 @@ class BleEventLoop:
     def instance(cls):
         """Get the singleton instance of the BLE event loop."""
         if cls._instance is None:
-            cls._instance = BleEventLoop()
+            with cls._instance_lock:
+                # Re-check under the lock so concurrent callers never start two loops
+                if cls._instance is None:
+                    cls._instance = BleEventLoop()
         return cls._instance
 
     def _thread_loop_runner(self):
@@ -67,7 +79,7 @@ class BleEventLoop:
         Returns:
             concurrent.futures.Future representing the scheduled coroutine
         """
-        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+        return self._submit(coro)
 
     def stop(self):
         """
@@ -4,6 +4,7 @@ BrainFlow Handler - Infrastructure component for managing BrainFlow board connec
 This module handles BrainFlow board preparation, streaming, and health monitoring.
 """
 
+import logging
 import time
 import threading
 from brainflow.board_shim import BoardShim, BrainFlowInputParams, BrainFlowPresets
@@ -13,6 +14,13 @@ from src.common.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Default BrainFlow ring buffer capacity, in samples (32 s of Muse EEG). Readers only
+# ever take the newest 1024 samples, so the buffer need not hold minutes of data.
+STREAM_BUFFER_SIZE = 8192
+
+# Boards that take the Muse "p50"/"p61" configuration commands
+MUSE_BOARD_IDS = (BoardIds.MUSE_2_BOARD, BoardIds.MUSE_S_BOARD)
+
 
 class BrainFlowHandler:
     """
@@ -22,7 +30,8 @@ class BrainFlowHandler:
     background thread checking board responsiveness.
     """
 
-    def __init__(self, board_id, input_params: BrainFlowInputParams, check_interval=1.0, timeout=5.0):
+    def __init__(self, board_id, input_params: BrainFlowInputParams, check_interval=1.0, timeout=5.0,
+                 ring_buffer_size=STREAM_BUFFER_SIZE):
         """
         Initialize the BrainFlow handler.
 
@@ -31,17 +40,29 @@ class BrainFlowHandler:
             input_params: BrainFlowInputParams instance with connection parameters
             check_interval: Seconds between alive checks
             timeout: Seconds after which board is considered unresponsive if no new data
+            ring_buffer_size: Capacity of BrainFlow's sample ring buffer
         """
         self.board_id = board_id
         self.input_params = input_params
         self.check_interval = check_interval
         self.timeout = timeout
+        self.ring_buffer_size = ring_buffer_size
         self.board = None
         self.alive = False
+        self._timestamp_channel = None  # Row of the timestamps in DEFAULT_PRESET data
         # Replace boolean flag with a threading.Event for stopping the thread.
         self._stop_event = threading.Event()
         self._check_thread = None
 
+        # BrainFlow's own board logger formats messages in the native library on every
+        # call; keep it only when the application itself is logging at DEBUG. Checked
+        # here rather than at import so LoggerSetup has already set the level.
+        if not logger.isEnabledFor(logging.DEBUG):
+            try:
+                BoardShim.disable_board_logger()
+            except Exception as e:
+                logger.debug(f"Could not disable BrainFlow board logger: {e}")
+
     def prepare_and_connect_board(self):
         """
         Prepare the BrainFlow session and start the data stream.
@@ -50,12 +71,14 @@ class BrainFlowHandler:
         try:
             self.board = BoardShim(self.board_id, self.input_params)
             self.board.prepare_session()
-            if self.board_id in [BoardIds.MUSE_2_BOARD, BoardIds.MUSE_S_BOARD]:
+            if self.board_id in MUSE_BOARD_IDS:
                 self.board.config_board("p50")  # Sets 5th EEG and PPG for Muse 2. Sets 5th EEG for Muse S.
                 self.board.config_board("p61")  # Sets PPG for Muse S, only works if p50 is set.
 
             # Start streaming; adjust buffer size or other parameters as needed.
-            self.board.start_stream(45000)
+            self.board.start_stream(self.ring_buffer_size)
+            # Constant per board id, so look it up once rather than on every alive check
+            self._timestamp_channel = BoardShim.get_timestamp_channel(self.board_id, BrainFlowPresets.DEFAULT_PRESET)
             self.alive = True
             # Clear the stop event and start the background thread
             self._stop_event.clear()
@@ -68,19 +91,29 @@ class BrainFlowHandler:
 
     def _check_alive_loop(self):
         """
-        Continuously check if new data is arriving by comparing the latest timestamp
-        from the board data with the current time.
+        Continuously check if new data is arriving by tracking the board's sample
+        count, falling back to comparing the latest timestamp with the current time.
         """
         logger.debug("Starting board alive check loop")
         last_timestamp = time.time()
-        while not self._stop_event.is_set():
+        last_count = 0
+        # wait() returns True as soon as delete_board() sets the event, so shutdown
+        # does not have to sit out the rest of a check interval
+        while not self._stop_event.wait(self.check_interval):
             try:
                 data_count = self.board.get_board_data_count()
-                if data_count > 0:
+                if data_count > last_count:
+                    # New samples arrived since the last check; no data copy needed
+                    last_timestamp = time.time()
+                elif data_count >= self.ring_buffer_size:
+                    # Count not growing because the ring buffer is full and the count has
+                    # saturated: only the newest sample's timestamp tells if data still flows.
+                    # Below capacity an unchanged count means no new data, with no copy needed
                     data_timestamp = self.board.get_current_board_data(1, BrainFlowPresets.DEFAULT_PRESET)[
-                        self.board.get_timestamp_channel(self.board_id, BrainFlowPresets.DEFAULT_PRESET)]
+                        self._timestamp_channel]
                     if len(data_timestamp) > 0:
-                        last_timestamp = float(data_timestamp)
+                        last_timestamp = float(data_timestamp[-1])
+                last_count = data_count
                 # If no new data is received for longer than timeout, consider connection dead.
                 current_time = time.time()
                 if current_time - last_timestamp > self.timeout:
@@ -90,12 +123,32 @@ class BrainFlowHandler:
             except Exception as e:
                 logger.error(f"Error checking board alive status: {e}")
                 self.alive = False
-            time.sleep(self.check_interval)
 
     def is_alive(self):
         """Return True if the board appears to be streaming data; otherwise False."""
         return self.alive
 
+    def wait_until_streaming(self, timeout, poll_interval=0.05):
+        """
+        Block until the board has buffered its first samples, up to timeout seconds.
+
+        Returns early if delete_board() is called meanwhile.
+
+        Returns:
+            bool: is_alive() once data arrived or the timeout expired
+        """
+        deadline = time.monotonic() + timeout
+        while self.board is not None:
+            try:
+                if self.board.get_board_data_count() > 0:
+                    break
+            except Exception as e:
+                logger.debug(f"Waiting for board data: {e}")
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or self._stop_event.wait(min(poll_interval, remaining)):
+                break
+        return self.is_alive()
+
     def delete_board(self):
         """
         Stop the data stream and release the BrainFlow session.
@@ -115,3 +168,4 @@ class BrainFlowHandler:
                 logger.error(f"Error during board deletion: {e}")
             finally:
                 self.board = None
+                self._timestamp_channel = None
@@ -10,7 +10,7 @@ from threading import Event
 import time
 
 from src.domain.interfaces.sensor_interface import SensorInterface
-from src.infrastructure.sensors.brainflow_handler import BrainFlowHandler
+from src.infrastructure.sensors.brainflow_handler import BrainFlowHandler, STREAM_BUFFER_SIZE
 from src.infrastructure.streaming.brainflow_lsl_publisher import BrainFlowLSLPublisher
 from brainflow.board_shim import BrainFlowInputParams, BoardIds, BoardShim
 
@@ -27,10 +27,13 @@ class MuseSensor(SensorInterface):
     and provides automatic reconnection on connection loss.
     """
 
+    status_interval = 10.0  # seconds between status checks
+
     def __init__(self):
         super(MuseSensor, self).__init__()
         self.board_id = BoardIds.MUSE_S_BOARD.value
         self.input_params = BrainFlowInputParams()
+        self.ring_buffer_size = STREAM_BUFFER_SIZE
         self.handler = None
         self.auto_reconnect_enabled = True
         self._connecting = False
@@ -60,12 +63,13 @@ class MuseSensor(SensorInterface):
                 time.sleep(1.0)  # Allow time for complete cleanup
 
                 logger.debug("Creating BrainFlowHandler...")
-                self.handler = BrainFlowHandler(self.board_id, self.input_params)
+                self.handler = BrainFlowHandler(self.board_id, self.input_params,
+                                                ring_buffer_size=self.ring_buffer_size)
                 logger.debug("Calling prepare_and_connect_board...")
                 self.handler.prepare_and_connect_board()
-                logger.debug("Board prepared, sleeping 2 seconds...")
-                time.sleep(2.0)  # Allow some time for the handler to update its status
-                is_alive = self.handler.is_alive()
+                logger.debug("Board prepared, waiting up to 2 seconds for data...")
+                # Proceed as soon as samples arrive instead of sleeping a fixed 2 seconds
+                is_alive = self.handler.wait_until_streaming(2.0)
                 logger.debug(f"handler.is_alive() = {is_alive}")
                 if is_alive:
                     self.connected = True
@@ -154,6 +158,7 @@ class MuseSensor(SensorInterface):
             self.lsl_publisher.update_board(self.handler.board)
             # Resume streaming by ensuring the streaming_enabled event is set.
             self._lsl_streaming_enabled.set()
+            self.lsl_publisher.wake()
             logger.info("LSL stream resumed with updated board")
             self.status_changed.emit("LSL stream resumed")
 
@@ -173,6 +178,7 @@ class MuseSensor(SensorInterface):
             self._lsl_stay_alive.clear()
             logger.warning("LSL publisher thread forcibly killed")
             if self.lsl_publisher and self.lsl_publisher.is_alive():
+                self.lsl_publisher.wake()
                 self.lsl_publisher.join(timeout=2.0)
             self.lsl_publisher = None
 
@@ -185,50 +191,35 @@ class MuseSensor(SensorInterface):
         else:
             return "Not Alive. Attempting automatic reconnection."
 
-    def _status_worker(self):
+    def _auto_reconnect(self):
         """
-        Background thread that checks the sensor's status periodically.
-        If the status changes, it emits the status_changed signal.
-        Also, if auto-reconnect is enabled and the sensor is disconnected,
-        it attempts to reconnect after a defined interval.
+        Clean up the lost BrainFlow session and reconnect (runs on a worker thread).
         """
-        while self._status_running:
-            current_status = self.get_status()
-            if current_status != self._last_status:
-                self._last_status = current_status
-                self.status_changed.emit(current_status)
-            # If auto-reconnect is enabled and sensor is disconnected,
-            # attempt to reconnect at defined intervals.
-            if self.auto_reconnect_enabled and current_status.startswith("Not Alive"):
-                now = time.time()
-                if now - self._last_reconnect_attempt >= self.reconnect_interval:
-                    self._last_reconnect_attempt = now
-
-                    # Don't reconnect if already connecting/disconnecting
-                    if self._connecting or self._disconnecting:
-                        logger.debug("Auto-reconnect: skipping, connection state change in progress")
-                    else:
-                        logger.warning("Connection lost. Cleaning up sessions")
-                        if self.handler:
-                            try:
-                                self.stop_stream()
-                                time.sleep(1.0)  # Allow time for the stream to stop
-                                self.handler.delete_board()
-                            except Exception as e:
-                                logger.error(f"Error during auto-reconnect cleanup: {e}")
-                            finally:
-                                self.handler = None
-
-                        # Fully clean up lingering sessions
-                        try:
-                            BoardShim.release_all_sessions()
-                        except Exception as e:
-                            logger.error(f"Error releasing sessions: {e}")
-
-                        # Wait for complete cleanup before reconnecting
-                        logger.info("Auto-reconnect: waiting 3 seconds for session cleanup...")
-                        time.sleep(3.0)
-
-                        logger.info("Auto-reconnect: attempting to reconnect sensor")
-                        self.connect()  # Expected to be non-blocking (or spawn its own thread)
-            time.sleep(10)
+        # Don't reconnect if already connecting/disconnecting
+        if self._connecting or self._disconnecting:
+            logger.debug("Auto-reconnect: skipping, connection state change in progress")
+            return
+
+        logger.warning("Connection lost. Cleaning up sessions")
+        if self.handler:
+            try:
+                self.stop_stream()
+                time.sleep(1.0)  # Allow time for the stream to stop
+                self.handler.delete_board()
+            except Exception as e:
+                logger.error(f"Error during auto-reconnect cleanup: {e}")
+            finally:
+                self.handler = None
+
+        # Fully clean up lingering sessions
+        try:
+            BoardShim.release_all_sessions()
+        except Exception as e:
+            logger.error(f"Error releasing sessions: {e}")
+
+        # Wait for complete cleanup before reconnecting
+        logger.info("Auto-reconnect: waiting 3 seconds for session cleanup...")
+        time.sleep(3.0)
+
+        logger.info("Auto-reconnect: attempting to reconnect sensor")
+        self.connect()  # Expected to be non-blocking (or spawn its own thread)
@@ -5,7 +5,10 @@ This adapter wraps the existing MuseSensor implementation and provides
 the ISensor interface for integration with the new architecture.
 """
 
+import weakref
+
 from src.domain.interfaces.i_sensor import ISensor
+from src.domain.interfaces.sensor_interface import release_sensor
 from src.common.constants.sensor_constants import SensorType, SensorStatus
 from src.common.exceptions.exceptions import (
     SensorException,
@@ -36,6 +39,11 @@ class MuseSensorAdapter(ISensor):
         """Initialize the Muse sensor adapter."""
         super().__init__()
         self._sensor = LegacyMuseSensor()
+        # Disconnect the sensor when the adapter is collected. Unlike __del__, the
+        # finalizer holds no reference to the adapter and does not run at interpreter
+        # exit, where shutdown order is undefined.
+        self._finalizer = weakref.finalize(self, release_sensor, self._sensor)
+        self._finalizer.atexit = False
         self._status = SensorStatus.DISCONNECTED.value
         self._is_connected = False
         self._is_streaming = False
@@ -219,11 +227,3 @@ class MuseSensorAdapter(ISensor):
 
         # Forward the status signal
         self.status_changed.emit(status)
-
-    def __del__(self):
-        """Cleanup when adapter is destroyed."""
-        try:
-            if self._is_connected:
-                self.disconnect()
-        except:
-            pass
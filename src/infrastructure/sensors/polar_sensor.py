@@ -11,6 +11,10 @@ Platform Support:
 """
 
 import time
+from collections import deque
+from threading import Event, Thread
+
+import numpy as np
 from PyQt5.QtCore import pyqtSignal
 
 from src.domain.interfaces.sensor_interface import SensorInterface
@@ -31,6 +35,34 @@ PMD_CONTROL            = "FB005C81-02E7-F387-1CAD-8ACD2D8DF0C8"
 PMD_DATA               = "FB005C82-02E7-F387-1CAD-8ACD2D8DF0C8"
 ECG_WRITE              = bytearray([0x02, 0x00, 0x00, 0x01, 0x82, 0x00, 0x01, 0x01, 0x0E, 0x00])
 ECG_SAMPLING_FREQ      = 130
+ECG_HEADER_SIZE        = 10  # PMD frame header bytes before the 24-bit samples
+ECG_QUEUE_FRAMES       = 512  # Raw frames buffered between the BLE callback and the decoder
+ECG_SCRATCH_SAMPLES    = 256  # Initial decode buffer size; a PMD ECG frame carries ~73 samples
+
+
+def _ecg_sample_count(frame):
+    """Number of 24-bit samples in a PMD ECG frame."""
+    return (len(frame) - ECG_HEADER_SIZE) // 3
+
+
+def _decode_ecg_samples(frame, packed, out):
+    """
+    Decode the little-endian signed 24-bit samples of a PMD ECG frame.
+
+    Args:
+        frame: Raw notification bytes (header included)
+        packed: uint8 scratch of shape (>= n, 4) whose first column is zero
+        out: float32 scratch of length >= n
+
+    Returns:
+        np.ndarray: float32 ECG samples in microvolts (a view of out)
+    """
+    n = _ecg_sample_count(frame)
+    raw = np.frombuffer(frame, dtype=np.uint8, count=n * 3, offset=ECG_HEADER_SIZE)
+    # Place each sample in the top 3 bytes of a little-endian int32; an arithmetic
+    # shift right by 8 then moves it down and sign-extends it, with no branches
+    packed[:n, 1:] = raw.reshape(n, 3)
+    return np.right_shift(packed[:n].view('<i4').reshape(n), 8, out=out[:n])
 
 
 class PolarSensor(SensorInterface):
@@ -41,6 +73,8 @@ class PolarSensor(SensorInterface):
     to avoid 'Event loop is closed' issues.
     """
 
+    status_interval = 10.0  # seconds between status checks
+
     def __init__(self):
         super().__init__()
         self.ble_client = None
@@ -50,8 +84,14 @@ class PolarSensor(SensorInterface):
         # For displaying a 'first sample arrived' message
         self._first_ecg_sample_received = False
 
-        # Check Bluetooth availability on initialization
-        self._check_bluetooth_capability()
+        # Raw ECG frames handed from the BLE callback to the decoder thread
+        self._ecg_frames = deque(maxlen=ECG_QUEUE_FRAMES)
+        self._ecg_wake = Event()
+        self._ecg_running = False
+        self._ecg_thread = None
+        # Decode buffers reused for every frame (grown if a larger frame arrives)
+        self._ecg_packed = np.zeros((ECG_SCRATCH_SAMPLES, 4), dtype=np.uint8)
+        self._ecg_scratch = np.empty(ECG_SCRATCH_SAMPLES, dtype=np.float32)
 
     def connect(self):
         """
@@ -64,6 +104,8 @@ class PolarSensor(SensorInterface):
         """
         Actual scanning + connecting on the shared event loop.
         """
+        # Off the GUI thread, since the probe may spawn a subprocess
+        self._check_bluetooth_capability()
         try:
             devices = await BleakScanner.discover()
             polar_dev = next((d for d in devices if d.name and "Polar" in d.name), None)
@@ -112,6 +154,7 @@ class PolarSensor(SensorInterface):
 
         # reset the 'first sample' flag
         self._first_ecg_sample_received = False
+        self._start_ecg_worker()
 
         # Start notifications on the event loop
         BleEventLoop.instance().run_in_loop(self._start_notify_task())
@@ -150,6 +193,7 @@ class PolarSensor(SensorInterface):
         """
         self.auto_reconnect_enabled = False
         self.stop_status_check()
+        self._stop_ecg_worker()
         BleEventLoop.instance().run_in_loop(self._async_disconnect())
 
     async def _async_disconnect(self):
@@ -179,56 +223,75 @@ class PolarSensor(SensorInterface):
     def _notification_handler(self, sender: str, data: bytearray):
         """
         Called by Bleak when new ECG data arrives.
+
+        Runs on the BLE event loop, so it only stamps and queues the frame;
+        decoding and the LSL push happen on the ECG worker thread.
         """
         if not self.outlet:
             return
-        if data and data[0] == 0x00:
-            step = 3
-            samples = data[10:]
-            offset = 0
-            ecg_values = []
-            while offset < len(samples):
-                val = int.from_bytes(samples[offset:offset+step], byteorder="little", signed=True)
-                ecg_values.append(val)
-                offset += step
-
-            if not self._first_ecg_sample_received and len(ecg_values) > 0:
-                self._first_ecg_sample_received = True
-                self.status_changed.emit("Polar ECG data is now arriving!")
-                logger.info("PolarSensor: First ECG sample received")
-
-            stamp = local_clock()
-            self.outlet.push_chunk(ecg_values, stamp)
-
-    def _status_worker(self):
+        if data and data[0] == 0x00 and len(data) > ECG_HEADER_SIZE:
+            self._ecg_frames.append((bytes(data), local_clock()))
+            self._ecg_wake.set()
+
+    def _start_ecg_worker(self):
+        """Start the thread that decodes queued ECG frames and pushes them to LSL."""
+        if self._ecg_thread is not None and self._ecg_thread.is_alive():
+            return
+        self._ecg_running = True
+        self._ecg_thread = Thread(target=self._ecg_worker, name="polar_ecg_decoder", daemon=True)
+        self._ecg_thread.start()
+
+    def _stop_ecg_worker(self):
+        """Stop the ECG decoder thread and drop any frames still queued."""
+        self._ecg_running = False
+        self._ecg_wake.set()
+        if self._ecg_thread is not None:
+            self._ecg_thread.join(timeout=2)
+            self._ecg_thread = None
+        self._ecg_frames.clear()
+
+    def _ecg_worker(self):
+        """Decode queued ECG frames and push them to the LSL outlet."""
+        frames = self._ecg_frames
+        while self._ecg_running:
+            self._ecg_wake.wait(timeout=1.0)
+            self._ecg_wake.clear()
+            while frames and self._ecg_running:
+                frame, stamp = frames.popleft()
+                outlet = self.outlet
+                if outlet is None:
+                    continue
+                n = _ecg_sample_count(frame)
+                if n > len(self._ecg_scratch):
+                    self._ecg_packed = np.zeros((n, 4), dtype=np.uint8)
+                    self._ecg_scratch = np.empty(n, dtype=np.float32)
+                ecg_values = _decode_ecg_samples(frame, self._ecg_packed, self._ecg_scratch)
+
+                if not self._first_ecg_sample_received and len(ecg_values) > 0:
+                    self._first_ecg_sample_received = True
+                    self.status_changed.emit("Polar ECG data is now arriving!")
+                    logger.info("PolarSensor: First ECG sample received")
+
+                outlet.push_chunk(ecg_values, stamp)
+
+    def _auto_reconnect(self):
         """
-        Background thread that checks the sensor's status periodically.
-        If the status changes, it emits the status_changed signal.
-        Also, if auto-reconnect is enabled and the sensor is disconnected,
-        it attempts to reconnect after a defined interval.
+        Restart notifications and reconnect (runs on a worker thread).
         """
-        while self._status_running:
-            current_status = self.get_status()
-            if current_status != self._last_status:
-                self._last_status = current_status
-                self.status_changed.emit(current_status)
-
-            if self.auto_reconnect_enabled and current_status.startswith("Not Alive"):
-                now = time.time()
-                if now - self._last_reconnect_attempt >= self.reconnect_interval:
-                    self._last_reconnect_attempt = now
-                    logger.info("PolarSensor: Auto-reconnecting...")
-                    self.stop_stream()
-                    time.sleep(1)
-                    self.connect()
-
-            time.sleep(10)
+        logger.info("PolarSensor: Auto-reconnecting...")
+        self.stop_stream()
+        time.sleep(1)
+        self.connect()
 
     def _check_bluetooth_capability(self):
         """
         Check if Bluetooth is available on the current platform.
         Logs warnings and helpful messages if issues are detected.
+
+        Runs on every connect, so the cached probe result is dropped first: the
+        user may have switched Bluetooth on since startup.
         """
+        BluetoothHelper.invalidate()
         available, error = BluetoothHelper.check_bluetooth_available()
 
         if not available:
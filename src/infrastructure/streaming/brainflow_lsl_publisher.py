@@ -5,16 +5,54 @@ This module provides a persistent LSL publisher that continuously streams
 BrainFlow data to Lab Streaming Layer outlets.
 """
 
+import ctypes
+import math
 import time
+from functools import lru_cache
 from threading import Event, Thread
 
+import numpy as np
 from brainflow import BoardShim, BrainFlowError, BrainFlowExitCodes, BrainFlowPresets
-from pylsl import StreamInfo, StreamOutlet, cf_double64, local_clock
+from pylsl import StreamInfo, StreamOutlet, cf_float32, local_clock
 
 from src.common.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+MAX_PULL_SAMPLES = 1024  # Most recent samples read from the board per data type and pass
+PULL_HEADROOM = 8  # Steady-state pull size, in multiples of the samples expected per pass
+
+
+def _chunk_pusher(outlet: StreamOutlet):
+    """
+    Return a push(chunk, timestamp) callable for a cf_float32 outlet.
+
+    Calls liblsl's push function for the outlet directly, skipping pylsl's
+    per-call type checks; falls back to push_chunk if this pylsl version does
+    not expose the outlet's handle.
+    """
+    push_fn = getattr(outlet, 'do_push_chunk', None)
+    handle = getattr(outlet, 'obj', None)
+    if push_fn is None or handle is None:
+        return outlet.push_chunk
+
+    float_p = ctypes.POINTER(ctypes.c_float)
+
+    def push(chunk: np.ndarray, timestamp: float):
+        # chunk must be a C-contiguous float32 (samples, channels) array
+        error_code = push_fn(handle, chunk.ctypes.data_as(float_p), ctypes.c_long(chunk.size),
+                             ctypes.c_double(timestamp), ctypes.c_int(1))
+        if error_code < 0:
+            logger.warning(f"liblsl push_chunk failed with error code {error_code}")
+
+    return push
+
+
+@lru_cache(maxsize=None)
+def _board_descr(board_id: int, preset: BrainFlowPresets) -> dict:
+    """BoardShim.get_board_descr, parsed once per board and preset (treat as read-only)."""
+    return BoardShim.get_board_descr(board_id, preset)
+
 
 class BrainFlowLSLPublisher(Thread):
     """
@@ -43,6 +81,8 @@ class BrainFlowLSLPublisher(Thread):
         Thread.__init__(self, name=thread_name, daemon=thread_daemon)
         self.stay_alive = stay_alive  # Controls overall thread lifetime.
         self.streaming_enabled = streaming_enabled  # Controls data pushing.
+        self._wake = Event()  # Cuts the loop's wait short (see wake()).
+        self._prepared = False  # Last known is_prepared() result, re-checked only on transitions.
         self.board_shim = board_shim
         self.board_id = board_shim.get_board_id()
 
@@ -56,34 +96,66 @@ class BrainFlowLSLPublisher(Thread):
         self.data_types = {}  # e.g. {'eeg': preset, ...}
         for data_type, preset in presets.items():
             if preset in all_presets:
-                description = BoardShim.get_board_descr(self.board_id, preset)
+                description = _board_descr(self.board_id, preset)
                 if (data_type + "_channels") in description:
                     self.data_types[data_type] = preset
 
         self.channels = {k: self.get_channels(v) for k, v in self.data_types.items()}
 
         # Create persistent LSL outlets.
-        self.outlets = {}
-        for data_type, preset in self.data_types.items():
-            rate = self.board_shim.get_sampling_rate(self.board_id, preset)
-            name = f'ixr-suite-{data_type}-data'
-            channel_count = len(self.channels[data_type])
-            logger.info(f"Creating persistent LSL outlet for {name} with {channel_count} channels at {rate} Hz")
-            info_data = StreamInfo(name=name, type=data_type.upper(), channel_count=channel_count,
-                                   nominal_srate=rate, channel_format=cf_double64,
-                                   source_id='ixr-suite-lsl-data-publisher')
-            stream_channels = info_data.desc().append_child("channels")
-            for _, label in self.channels[data_type].items():
-                ch = stream_channels.append_child("channel")
-                ch.append_child_value("label", label)
-                if data_type == 'eeg':
-                    ch.append_child_value("unit", 'microvolts')
-                ch.append_child_value("type", data_type)
-            self.outlets[data_type] = StreamOutlet(info_data)
-            logger.info(f"Persistent LSL outlet created for {data_type} (name: {info_data.name()})")
-
-        self.previous_timestamp = {'eeg': 0, 'gyro': 0, 'ppg': 0}
+        self.outlets = {
+            data_type: self._create_outlet(data_type, preset)
+            for data_type, preset in self.data_types.items()
+        }
+
         self.local2lsl_time_diff = time.time() - local_clock()  # compute offset.
+        self._cache_board_metadata()
+
+    def _create_outlet(self, data_type: str, preset: BrainFlowPresets) -> StreamOutlet:
+        """Create the LSL outlet for one data type, with its channel description."""
+        rate = self.board_shim.get_sampling_rate(self.board_id, preset)
+        name = f'ixr-suite-{data_type}-data'
+        channel_count = len(self.channels[data_type])
+        logger.info(f"Creating persistent LSL outlet for {name} with {channel_count} channels at {rate} Hz")
+        info_data = StreamInfo(name=name, type=data_type.upper(), channel_count=channel_count,
+                               nominal_srate=rate, channel_format=cf_float32,
+                               source_id='ixr-suite-lsl-data-publisher')
+        stream_channels = info_data.desc().append_child("channels")
+        for label in self.channels[data_type].values():
+            ch = stream_channels.append_child("channel")
+            ch.append_child_value("label", label)
+            if data_type == 'eeg':
+                ch.append_child_value("unit", 'microvolts')
+            ch.append_child_value("type", data_type)
+        outlet = StreamOutlet(info_data)
+        logger.info(f"Persistent LSL outlet created for {data_type} (name: {info_data.name()})")
+        return outlet
+
+    def _cache_board_metadata(self):
+        """Look up per-preset board metadata once instead of on every loop iteration."""
+        # The first data type sets the polling rate
+        primary_preset = next(iter(self.data_types.values()), BrainFlowPresets.DEFAULT_PRESET)
+        self._primary_srate = self.board_shim.get_sampling_rate(self.board_id, primary_preset)
+        self._period = 1.0 / self._primary_srate
+
+        # One (preset, timestamp column, channel rows, push buffer, push function, minimum pull)
+        # record per data type, in data_types order; previous_timestamp and pull_sizes are
+        # indexed the same way. The push buffer is a reusable (samples, channels) array
+        # sized for a full pull.
+        self._jobs = tuple(
+            (preset,
+             self.board_shim.get_timestamp_channel(self.board_id, preset),
+             np.asarray(list(self.channels[data_type].keys()), dtype=np.intp),
+             np.empty((MAX_PULL_SAMPLES, len(self.channels[data_type])), dtype=np.float32),
+             _chunk_pusher(self.outlets[data_type]),
+             min(MAX_PULL_SAMPLES, math.ceil(
+                 self.board_shim.get_sampling_rate(self.board_id, preset) * self._period * PULL_HEADROOM)))
+            for data_type, preset in self.data_types.items()
+        )
+        self.previous_timestamp = [0.0] * len(self._jobs)
+        # Samples to request per pull: a full window until the first push, then sized
+        # to what actually arrives (see run)
+        self._pull_sizes = [MAX_PULL_SAMPLES] * len(self._jobs)
 
     def update_board(self, new_board_shim: BoardShim):
         """
@@ -94,51 +166,100 @@ class BrainFlowLSLPublisher(Thread):
         """
         self.board_shim = new_board_shim
         self.board_id = new_board_shim.get_board_id()
-        # Optionally reset timestamps.
-        self.previous_timestamp = {k: 0 for k in self.previous_timestamp}
+        # Re-reading the metadata also resets the timestamps.
+        self._cache_board_metadata()
+        self._prepared = False
         logger.info("LSL publisher: board updated")
 
+    def wake(self):
+        """
+        Wake the publisher loop immediately.
+
+        Call after clearing stay_alive or setting streaming_enabled so the thread
+        reacts without waiting out its current sleep.
+        """
+        self._wake.set()
+
+    def _wait(self, timeout: float):
+        """Sleep for up to timeout seconds, returning early if woken."""
+        if self._wake.wait(timeout):
+            self._wake.clear()
+
     def run(self) -> None:
         """Main loop: while stay_alive is set, check if streaming is enabled and push data."""
         logger.info("LSL Publisher thread started, entering main loop")
         iteration_count = 0
+        deadline = time.monotonic()
         while self.stay_alive.is_set():
             if iteration_count == 0 or iteration_count % 100 == 0:
                 logger.debug(f"Loop iteration {iteration_count}, streaming_enabled={self.streaming_enabled.is_set()}")
             iteration_count += 1
 
             if self.streaming_enabled.is_set():
-                if not self.board_shim.is_prepared():
-                    if iteration_count % 100 == 0:
-                        logger.debug("Board not prepared yet...")
-                    time.sleep(0.1)
-                    continue
-
-                for data_type, preset in self.data_types.items():
-                    timestamp_column = self.board_shim.get_timestamp_channel(self.board_id, preset)
+                # Board preparation only changes on connect/disconnect, so the FFI check
+                # runs until the board is ready and again after the session is lost
+                if not self._prepared:
+                    self._prepared = self.board_shim.is_prepared()
+                    if not self._prepared:
+                        if iteration_count % 100 == 0:
+                            logger.debug("Board not prepared yet...")
+                        self._wait(0.1)
+                        deadline = time.monotonic()
+                        continue
+
+                previous_timestamp = self.previous_timestamp
+                pull_sizes = self._pull_sizes
+                for i, (preset, timestamp_column, channel_idx, chunk_buf, push, min_pull) in enumerate(self._jobs):
                     try:
-                        data = self.board_shim.get_current_board_data(1024, preset)
+                        data = self.board_shim.get_current_board_data(pull_sizes[i], preset)
+                        # BrainFlow timestamps are monotonic, so the new samples are a suffix:
+                        # find it with a binary search and slice (no mask, no gathered copy)
+                        timestamps = data[timestamp_column]
+                        start = np.searchsorted(timestamps, previous_timestamp[i], side='right')
+                        if start == 0 and previous_timestamp[i] and pull_sizes[i] < MAX_PULL_SAMPLES:
+                            # Every pulled sample is new, so the short window may not reach
+                            # back to the last push: pull the full window this time
+                            data = self.board_shim.get_current_board_data(MAX_PULL_SAMPLES, preset)
+                            timestamps = data[timestamp_column]
+                            start = np.searchsorted(timestamps, previous_timestamp[i], side='right')
                     except BrainFlowError as e:
                         if e.exit_code == BrainFlowExitCodes.INVALID_ARGUMENTS_ERROR:
                             continue
+                        elif e.exit_code == BrainFlowExitCodes.BOARD_NOT_CREATED_ERROR:
+                            # Session went away: go back to polling is_prepared()
+                            self._prepared = False
+                            break
                         else:
                             raise e
 
-                    data = data[:, data[timestamp_column] > self.previous_timestamp[data_type]]
-                    if data.shape[1] > 0:
-                        self.previous_timestamp[data_type] = data[timestamp_column, -1]
-                        data = data[list(self.channels[data_type].keys()), :]
-                        self.outlets[data_type].push_chunk(
-                            data.T.tolist(),
-                            self.previous_timestamp[data_type] - self.local2lsl_time_diff
-                        )
-                # Sleep according to sampling rate.
-                srate = self.board_shim.get_sampling_rate(self.board_id,
-                           self.data_types[list(self.data_types.keys())[0]])
-                time.sleep(1.0 / srate)
+                    # Only the newest few samples are copied out of BrainFlow per pass;
+                    # leave room for twice the latest arrival count
+                    pull_sizes[i] = min(MAX_PULL_SAMPLES, max(min_pull, 2 * (timestamps.size - start)))
+                    if start < timestamps.size:
+                        previous_timestamp[i] = timestamps[-1]
+                        # BrainFlow hands back float64 (channels, samples); the outlet
+                        # wants (samples, channels). Narrow the outlet's rows into the
+                        # C-contiguous float32 push buffer explicitly (np.take's out=
+                        # must match the source dtype). Its layout matches cf_float32,
+                        # so it is pushed as is.
+                        chunk = chunk_buf[:timestamps.size - start]
+                        np.copyto(chunk, data[channel_idx, start:].T, casting='same_kind')
+                        push(chunk, previous_timestamp[i] - self.local2lsl_time_diff)
+                # Sleep until the next sample period on a fixed schedule, so the time
+                # spent pushing does not make the loop drift
+                deadline += self._period
+                delay = deadline - time.monotonic()
+                if delay > 0:
+                    self._wait(delay)
+                elif delay < -10 * self._period:
+                    # Fell far behind (e.g. a slow pull): resynchronise instead of spinning
+                    deadline = time.monotonic()
             else:
-                # If streaming is paused, sleep briefly.
-                time.sleep(0.1)
+                # Streaming is paused: block until woken by resume/shutdown, and
+                # re-check the board before pushing again
+                self._prepared = False
+                self._wait(1.0)
+                deadline = time.monotonic()
 
         logger.info("LSL Publisher thread exiting")
 
@@ -156,7 +277,7 @@ class BrainFlowLSLPublisher(Thread):
             ValueError: If preset is unrecognized
         """
         channels = {}
-        description = BoardShim.get_board_descr(self.board_id, preset)
+        description = _board_descr(self.board_id, preset)
         if preset == BrainFlowPresets.DEFAULT_PRESET:
             channels.update(dict(zip(description['eeg_channels'], description['eeg_names'].split(","))))
         elif preset == BrainFlowPresets.AUXILIARY_PRESET:
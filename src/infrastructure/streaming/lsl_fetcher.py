@@ -5,7 +5,7 @@ This module provides optimized LSL stream discovery with async capabilities
 and caching to prevent UI freezing.
 """
 
-from pylsl import resolve_streams, StreamInfo
+from pylsl import resolve_streams, ContinuousResolver, StreamInfo
 from PyQt5.QtCore import QThread, pyqtSignal
 import time
 
@@ -56,6 +56,12 @@ class LSLFetcher:
         self.cache_timestamp = 0
         self.cache_ttl = 2.0  # Cache valid for 2 seconds
         self.discovery_thread = None
+
+        # liblsl keeps this resolver's stream list up to date in the background,
+        # so synchronous lookups are a snapshot read instead of a network wait
+        self._resolver = ContinuousResolver()
+        self._resolver_started = time.time()
+        self.resolver_warmup = 1.0  # Seconds before the resolver's first round is complete
         logger.debug("LSLFetcher initialized")
 
     def get_available_streams(self, use_cache=True):
@@ -77,8 +83,12 @@ class LSLFetcher:
                 logger.debug(f"Using cached streams ({len(self.cached_streams)} streams, age: {cache_age:.1f}s)")
                 return self.cached_streams
 
-        # Cache miss or expired - do discovery
-        streams = resolve_streams(wait_time=0.1)  # OPTIMIZED: Minimal wait for instant discovery
+        # Cache miss or expired - read the continuous resolver's snapshot
+        streams = self._resolver.results() if self._resolver is not None else []
+        if not streams and (self._resolver is None
+                            or time.time() - self._resolver_started < self.resolver_warmup):
+            # Closed, or right after startup before the resolver finished a round
+            streams = resolve_streams(wait_time=0.1)
         logger.info(f"Found {len(streams)} LSL stream(s)")
         for s in streams:
             logger.debug(f"  - {s.name()} ({s.type()}) - {s.channel_count()} channels")
@@ -109,6 +119,12 @@ class LSLFetcher:
         self.discovery_thread.streams_found.connect(callback)
         self.discovery_thread.start()
 
+    def close(self):
+        """Stop the background resolver."""
+        if self._resolver is not None:
+            self._resolver = None  # liblsl stops the resolver when it is released
+            logger.debug("LSL resolver closed")
+
     def clear_cache(self):
         """Clear the stream cache."""
         self.cached_streams = []
@@ -6,13 +6,11 @@ and EEG band powers with start/stop control. Uses BrainFlow directly instead of
 """
 
 import numpy as np
-import pyqtgraph as pg
 from PyQt5.QtCore import Qt
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
                              QMessageBox)
 
 from src.presentation.components.brain_power_settings_dialog import BrainPowerSettingsDialog
-from src.application.services.brain_power_worker import BrainPowerWorker
 from gui.modern_theme import ModernTheme
 
 
@@ -38,21 +36,30 @@ class BrainPowerAnalysisModule(QWidget):
             "offset": 0.5,          # Match original IXR-Suite
             "head_impact": 0.2,
             "longerterm_length": 30,
-            "reference": "mean"     # Match original IXR-Suite
+            "reference": "mean",    # Match original IXR-Suite
+            "zero_phase": True      # Zero-phase bad-channel filters (False: single causal pass)
         }
         self.settings = self.default_settings.copy()
 
         # Worker thread
         self.worker = None
 
-        # Ring buffers for temporal data (store last 100 points)
+        # Preallocated history for temporal data (store last 100 points); rows are
+        # short-term, long-term and final power, plotted as views without new arrays
         self.max_history = 100
-        self.short_term_history = []
-        self.long_term_history = []
-        self.final_power_history = []
+        self._history_x = np.arange(self.max_history, dtype=np.float32)
+        self._history = np.zeros((3, self.max_history), dtype=np.float32)
+        self._history_len = 0
 
-        # UI setup
-        self.init_ui()
+        # UI setup is deferred to the first showEvent so an unopened tab costs nothing
+        self._ui_built = False
+
+    def showEvent(self, event):
+        """Build the UI the first time the tab is shown."""
+        if not self._ui_built:
+            self._ui_built = True
+            self.init_ui()
+        super().showEvent(event)
 
     def handle_status_update(self, status_msg):
         """Handle status updates from worker thread."""
@@ -87,6 +94,9 @@ class BrainPowerAnalysisModule(QWidget):
 
     def init_ui(self):
         """Initialize the UI layout."""
+        # Imported here so loading the dashboard does not pull in pyqtgraph
+        import pyqtgraph as pg
+
         layout = QVBoxLayout(self)
         layout.setContentsMargins(16, 16, 16, 16)
         layout.setSpacing(12)
@@ -364,9 +374,10 @@ class BrainPowerAnalysisModule(QWidget):
             self.settings.update(new_settings)
 
             # Clear history buffers for new session
-            self.short_term_history = []
-            self.long_term_history = []
-            self.final_power_history = []
+            self._history_len = 0
+
+            # Deferred import: the worker pulls in scipy.signal and brainflow
+            from src.application.services.brain_power_worker import BrainPowerWorker
 
             # Create and start worker with board_shim
             self.worker = BrainPowerWorker(self.settings, board_shim)
@@ -430,24 +441,21 @@ class BrainPowerAnalysisModule(QWidget):
 
     def handle_analysis_update(self, final_power, short_term, long_term, band_powers):
         """Handle analysis update from worker thread."""
-        # Append new values to history
-        self.short_term_history.append(short_term)
-        self.long_term_history.append(long_term)
-        self.final_power_history.append(final_power)
-
-        # Maintain maximum history length (ring buffer)
-        if len(self.short_term_history) > self.max_history:
-            self.short_term_history.pop(0)
-        if len(self.long_term_history) > self.max_history:
-            self.long_term_history.pop(0)
-        if len(self.final_power_history) > self.max_history:
-            self.final_power_history.pop(0)
+        # Append new values to history, sliding left once the buffer is full
+        n = self._history_len
+        if n < self.max_history:
+            self._history_len = n + 1
+        else:
+            n -= 1
+            self._history[:, :-1] = self._history[:, 1:]
+        self._history[:, n] = (short_term, long_term, final_power)
 
         # Update line plots with temporal data
-        x = list(range(len(self.short_term_history)))
-        self.short_term_curve.setData(x, self.short_term_history)
-        self.long_term_curve.setData(x, self.long_term_history)
-        self.final_power_curve.setData(x, self.final_power_history)
+        n = self._history_len
+        x = self._history_x[:n]
+        self.short_term_curve.setData(x, self._history[0, :n])
+        self.long_term_curve.setData(x, self._history[1, :n])
+        self.final_power_curve.setData(x, self._history[2, :n])
 
         # Update band powers bar chart with minimum height to ensure visibility
         # Handle NaN/Inf values and ensure all bars are visible
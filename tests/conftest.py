@@ -0,0 +1,8 @@
+"""Shared pytest setup: make the repository root importable as the ``src`` package root."""
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
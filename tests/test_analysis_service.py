@@ -0,0 +1,39 @@
+"""Tests for AnalysisService's coalesced result publishing."""
+
+import threading
+
+import pytest
+
+pytest.importorskip("PyQt5")
+
+from PyQt5.QtCore import QCoreApplication  # noqa: E402
+
+from src.application.services.analysis_service import AnalysisService  # noqa: E402
+
+
+@pytest.fixture
+def service():
+    app = QCoreApplication.instance() or QCoreApplication([])  # noqa: F841 (QTimer needs an app)
+    service = AnalysisService()
+    yield service
+    service.cleanup()
+
+
+def test_publish_coalesces_results_from_other_threads(service):
+    received = []
+    service.analysis_updated.connect(received.append)
+
+    def produce():
+        for i in range(5):
+            service.publish_analysis_results({"brain_power": i})
+
+    producer = threading.Thread(target=produce)
+    producer.start()
+    producer.join()
+    assert received == []  # Nothing is emitted on the caller's thread
+
+    service._flush_analysis_results()  # One publish-timer tick
+    assert received == [{"brain_power": 4}]
+
+    service._flush_analysis_results()  # Nothing new pending
+    assert received == [{"brain_power": 4}]
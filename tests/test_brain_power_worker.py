@@ -0,0 +1,97 @@
+"""Tests for BrainPowerWorker's per-tick processing on raw BrainFlow frames."""
+
+import numpy as np
+import pytest
+
+pytest.importorskip("PyQt5")
+brainflow = pytest.importorskip("brainflow")
+pytest.importorskip("pylsl")
+
+from brainflow import BoardIds, BoardShim, BrainFlowPresets  # noqa: E402
+
+from src.application.services.brain_power_worker import BrainPowerWorker  # noqa: E402
+
+SETTINGS = {
+    "calib_length": 600,
+    "power_length": 10,
+    "scale": 1.5,
+    "offset": 0.5,
+    "head_impact": 0.2,
+    "longerterm_length": 30,
+    "reference": "mean",
+}
+
+
+class _StaticBoard:
+    """Just enough of a BoardShim for the worker's constructor (no session)."""
+
+    def get_board_id(self):
+        return BoardIds.MUSE_2_BOARD.value
+
+
+@pytest.fixture
+def worker():
+    return BrainPowerWorker(SETTINGS, _StaticBoard())
+
+
+def _raw_frame(worker, n_samples):
+    """A float64 frame shaped like get_current_board_data for the EEG preset."""
+    n_rows = BoardShim.get_num_rows(BoardIds.MUSE_2_BOARD.value, BrainFlowPresets.DEFAULT_PRESET)
+    rng = np.random.default_rng(0)
+    frame = np.zeros((n_rows, n_samples), dtype=np.float64)
+    t = np.arange(n_samples) / worker.eeg_sr
+    for ch in worker.eeg_channels:
+        frame[ch.ch_number] = 20 * rng.standard_normal(n_samples) + 30 * np.sin(2 * np.pi * 10 * t) + 800
+    frame[worker._ts_channel] = 1.7e9 + t
+    return frame
+
+
+def test_detect_bad_channels_accepts_float64_frame(worker):
+    frame = _raw_frame(worker, worker._eeg_win)
+    assert frame.dtype == np.float64
+
+    bad = worker._detect_bad_channels(frame)
+
+    assert isinstance(bad, tuple)
+    assert all(not ch.reference for ch in bad)
+
+
+def test_detect_bad_channels_flags_flat_channel(worker):
+    frame = _raw_frame(worker, worker._eeg_win)
+    flat = next(ch for ch in worker.eeg_channels if not ch.reference)
+    frame[flat.ch_number] = 800.0
+
+    bad = worker._detect_bad_channels(frame)
+
+    assert flat in bad
+
+
+def _list_weighted_mean(hist):
+    """The original list-and-loop weighted mean the ring replaces."""
+    weighted_sum = 0
+    sumweight = 0
+    for count, hist_val in enumerate(hist):
+        weighted_sum += hist_val * count
+        sumweight += count
+    return weighted_sum / sumweight if sumweight > 0 else 0
+
+
+def test_set_parameters_twice_keeps_history(worker):
+    rng = np.random.default_rng(1)
+    reference = [0, 1]
+
+    def push(n):
+        for value in rng.standard_normal(n):
+            if len(reference) > worker.hist_length:
+                del reference[0]
+            reference.append(value)
+            worker.engagement_hist.append(value)
+
+    worker.set_parameters()
+    push(worker.hist_length + 7)  # Wrap the ring so its oldest value is mid-buffer
+    worker.set_parameters()  # Re-seeds the history from the existing ring
+    assert len(worker.engagement_hist) == len(reference)
+    np.testing.assert_allclose(list(worker.engagement_hist), reference)
+
+    push(3)
+    assert worker.engagement_hist.weighted_mean() == pytest.approx(_list_weighted_mean(reference))
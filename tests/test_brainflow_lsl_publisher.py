@@ -0,0 +1,88 @@
+"""Tests for BrainFlowLSLPublisher pushing BrainFlow frames to its outlets."""
+
+from threading import Event
+
+import numpy as np
+import pytest
+
+pytest.importorskip("brainflow")
+pytest.importorskip("pylsl")
+
+from brainflow import BoardIds, BoardShim  # noqa: E402
+
+from src.infrastructure.streaming.brainflow_lsl_publisher import BrainFlowLSLPublisher  # noqa: E402
+
+BOARD_ID = BoardIds.MUSE_2_BOARD.value
+N_SAMPLES = 12
+
+
+class _RecordingOutlet:
+    """Stands in for a StreamOutlet; records what push_chunk receives."""
+
+    def __init__(self):
+        self.chunks = []
+
+    def push_chunk(self, chunk, timestamp=0.0, pushthrough=True):
+        self.chunks.append(np.array(chunk, copy=True))
+
+
+class _FrameBoard:
+    """
+    Serves float64 frames shaped like get_current_board_data and ends the
+    publisher loop once ``pending`` pulls have been served.
+    """
+
+    def __init__(self, stay_alive):
+        self._stay_alive = stay_alive
+        self.pending = 1
+
+    def get_board_id(self):
+        return BOARD_ID
+
+    def get_sampling_rate(self, board_id, preset):
+        return BoardShim.get_sampling_rate(board_id, preset)
+
+    def get_timestamp_channel(self, board_id, preset):
+        return BoardShim.get_timestamp_channel(board_id, preset)
+
+    def is_prepared(self):
+        return True
+
+    def get_current_board_data(self, num_samples, preset):
+        n_rows = BoardShim.get_num_rows(BOARD_ID, preset)
+        frame = np.tile(np.arange(N_SAMPLES, dtype=np.float64), (n_rows, 1))
+        frame += 1000.0 * np.arange(n_rows)[:, None]  # row r holds r*1000 + sample index
+        frame[BoardShim.get_timestamp_channel(BOARD_ID, preset)] = 1.7e9 + np.arange(N_SAMPLES) / 256
+        self.pending -= 1
+        if self.pending <= 0:
+            self._stay_alive.clear()
+        return frame
+
+
+def test_run_pushes_float64_frame_as_float32_chunks(monkeypatch):
+    outlets = {}
+
+    def create_outlet(self, data_type, preset):
+        outlets[data_type] = _RecordingOutlet()
+        return outlets[data_type]
+
+    monkeypatch.setattr(BrainFlowLSLPublisher, "_create_outlet", create_outlet)
+
+    stay_alive, streaming_enabled = Event(), Event()
+    stay_alive.set()
+    streaming_enabled.set()
+    board = _FrameBoard(stay_alive)
+    publisher = BrainFlowLSLPublisher(board, stay_alive, streaming_enabled)
+    board.pending = len(publisher.data_types)  # One pull per data type, then stop
+
+    publisher.run()  # In the calling thread; returns once the board clears stay_alive
+
+    assert outlets
+    for data_type, outlet in outlets.items():
+        assert len(outlet.chunks) == 1
+        chunk = outlet.chunks[0]
+        rows = list(publisher.channels[data_type].keys())
+        assert chunk.dtype == np.float32
+        assert chunk.shape == (N_SAMPLES, len(rows))
+        expected = np.arange(N_SAMPLES)[:, None] + 1000.0 * np.asarray(rows)[None, :]
+        np.testing.assert_array_equal(chunk, expected.astype(np.float32))
@@ -0,0 +1,39 @@
+"""Tests for BrainFlowSignalProcessor's band-power integration."""
+
+import numpy as np
+import pytest
+
+pytest.importorskip("brainflow")
+
+from src.application.services.signal_processor import BrainFlowSignalProcessor  # noqa: E402
+from src.common.exceptions.exceptions import InvalidFilterParametersError  # noqa: E402
+
+# 1 Hz bins from 0 to 128 Hz with a flat unit PSD: a band's power is its width
+FREQS = np.arange(129, dtype=np.float64)
+PSD = np.ones_like(FREQS)
+
+
+@pytest.fixture
+def processor():
+    return BrainFlowSignalProcessor()
+
+
+def test_compute_band_power_integrates_flat_psd(processor):
+    assert processor.compute_band_power((FREQS, PSD), (8.0, 13.0)) == pytest.approx(5.0)
+
+
+def test_compute_band_power_rejects_band_narrower_than_two_bins(processor):
+    with pytest.raises(InvalidFilterParametersError):
+        processor.compute_band_power((FREQS, PSD), (10.2, 10.8))
+
+
+def test_compute_eeg_bands_warns_once_per_sparse_grid(processor, caplog):
+    coarse = np.array([0.0, 2.0, 6.0, 10.0, 20.0, 40.0])  # No two bins inside theta or alpha
+    for _ in range(3):
+        bands = processor.compute_eeg_bands((coarse, np.ones_like(coarse)))
+
+    assert bands.dtype == np.float32
+    assert bands[2] == 0.0
+    warnings = [r for r in caplog.records if r.levelname == "WARNING"]
+    assert len(warnings) == 1
+    assert "alpha" in warnings[0].getMessage()